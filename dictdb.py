@@ -6,15 +6,34 @@ from aqt.utils import showInfo
 from .miutils import miInfo
 import re
 import json
+import logging
+from functools import lru_cache
 addon_path = os.path.dirname(__file__)
+logger = logging.getLogger(__name__)
 from aqt import mw
 from .init_db import initialize_sqlite_file
 
+
+def _nl2br(text):
+    return text.replace('\n', '<br>')
+
+
+@lru_cache(maxsize=8192)
+def _cachedSearch(db, dictName, toQuery, dictLimit, termTuple):
+    # Reopened cards and re-rendered fields look up the same terms, every write clears this
+    return db.querySearch(dictName, toQuery, dictLimit, termTuple)
+
+
 class DictDB:
-    conn = None
-    c = None
 
-    def __init__(self):
+    def __getattr__(self, name):
+        # The database is opened by the first query rather than while Anki loads the add-on
+        if name in ('conn', 'c'):
+            self.open()
+            return self.__dict__[name]
+        raise AttributeError(name)
+
+    def open(self):
         db_dir = os.path.join(addon_path, "user_files", "db")
         os.makedirs(db_dir, exist_ok=True)
         db_file = os.path.join(db_dir, "dictionaries.sqlite")
@@ -25,26 +44,39 @@ class DictDB:
             f.close()
             initialize_sqlite_file(db_file)
                 
-        self.conn=sqlite3.connect(db_file, check_same_thread=False)
+        # Search SQL differs per dictionary, column and limit, keep more of it prepared than the default
+        self.conn=sqlite3.connect(db_file, check_same_thread=False, cached_statements=512)
         self.c = self.conn.cursor()
-        self.c.execute("PRAGMA foreign_keys = ON")
-        self.c.execute("PRAGMA case_sensitive_like=ON;")
+        self.configureConnection()
 
     def connect(self):
         self.oldConnection = self.c
         db_file = os.path.join(mw.pm.addonFolder(), addon_path, "user_files", "db", "dictionaries.sqlite")
-        self.conn=sqlite3.connect(db_file)
+        self.conn=sqlite3.connect(db_file, cached_statements=512)
         self.c = self.conn.cursor()
+        self.configureConnection()
+
+    def configureConnection(self):
         self.c.execute("PRAGMA foreign_keys = ON")
         self.c.execute("PRAGMA case_sensitive_like=ON;")
+        # Lookups far outnumber writes, WAL keeps them from waiting on journal syncs during imports
+        self.c.execute("PRAGMA journal_mode=WAL;")
+        self.c.execute("PRAGMA synchronous=NORMAL;")
+        self.c.execute("PRAGMA temp_store=MEMORY;")
+        self.c.execute("PRAGMA cache_size=-65536;")
+        self.c.execute("PRAGMA mmap_size=268435456;")
 
     def reload(self):
         self.c.close()
         self.c = self.oldConnection
 
     def closeConnection(self):
+        # Nothing to close if no query ever opened the database
+        if 'conn' not in self.__dict__:
+            return
         self.c.close()
-        self = False
+        self.conn.close()
+        self.clearSearchCache()
 
 
 
@@ -244,9 +276,9 @@ class DictDB:
 
 
     def getDuplicateSetting(self, name):
-        self.c.execute('SELECT duplicateHeader, termHeader  FROM dictnames WHERE dictname=?', (name, ))
+        cur = self.conn.execute('SELECT duplicateHeader, termHeader  FROM dictnames WHERE dictname=?', (name, ))
         try:
-            (duplicateHeader,termHeader) = self.c.fetchone()
+            (duplicateHeader,termHeader) = cur.fetchone()
             return duplicateHeader, json.loads(termHeader)
         except:
             return None
@@ -341,7 +373,9 @@ class DictDB:
 
             toQuery = self.getQueryCriteria(column, terms, op)  
             termTuple = tuple(terms)  
-            allRs = self.executeSearch(dic['dict'], toQuery, dictLimit, termTuple)
+            # Rows past the overall result cap would be thrown away, so don't have SQLite produce them
+            limit = str(min(int(dictLimit), maxDefs - totalDefs))
+            allRs = self.executeSearch(dic['dict'], toQuery, limit, termTuple)
             if len(allRs) > 0:
                 dictRes = []
                 for r in allRs:
@@ -356,7 +390,7 @@ class DictDB:
                 for col in columns:
                     toQuery = self.getQueryCriteria(col, terms, op)  
                     termTuple = tuple(terms)  
-                    allRs = self.executeSearch(dic['dict'], toQuery, dictLimit, termTuple)
+                    allRs = self.executeSearch(dic['dict'], toQuery, limit, termTuple)
                     if len(allRs) > 0:
                         dictRes = []
                         for r in allRs:
@@ -367,7 +401,7 @@ class DictDB:
                                 return results
                         results[self.cleanDictName(dic['dict'])] = dictRes
                         break
-                    print("searchTerm:", results)
+                    logger.debug("searchTerm: %s", results)
         return results
 
     def resultToDict(self, r):
@@ -377,25 +411,27 @@ class DictDB:
             'altterm': r[1],
             'pronunciation': r[2],
             'pos': r[3],
-            'definition': r[4].replace('\n', '<br>'),
+            'definition': _nl2br(r[4]),
             'examples': r[5],
             'audio': r[6],
             'starCount': r[7]
         }
 
-        # Print the components of the output dictionary
-        print("Output Components:")
-        for key, value in output.items():
-            print(f"{key}: {value}")
+        # Log the components of the output dictionary, only formatted when debug logging is on
+        logger.debug("Output Components: %s", output)
 
         # Return the output dictionary
         return output
 
     def executeSearch(self, dictName, toQuery, dictLimit, termTuple):
+        return _cachedSearch(self, dictName, toQuery, dictLimit, termTuple)
+
+    def querySearch(self, dictName, toQuery, dictLimit, termTuple):
         try:
-            self.c.execute("SELECT term, altterm, pronunciation, pos, definition, examples, audio, starCount FROM " + dictName +" WHERE " + toQuery + " ORDER BY LENGTH(term) ASC, frequency ASC LIMIT "+dictLimit +" ;", termTuple)
-            out = self.c.fetchall()
-            print("executeSearch", out)
+            # A cursor per lookup, exports run searches from worker threads while the window searches too
+            cur = self.conn.execute("SELECT term, altterm, pronunciation, pos, definition, examples, audio, starCount FROM " + dictName +" WHERE " + toQuery + " ORDER BY LENGTH(term) ASC, frequency ASC LIMIT "+dictLimit +" ;", termTuple)
+            out = cur.fetchall()
+            logger.debug("executeSearch %s", out)
             return out
         except:
             return []
@@ -515,3 +551,8 @@ class DictDB:
 
     def commitChanges(self):
         self.conn.commit()
+        self.clearSearchCache()
+
+    def clearSearchCache(self):
+        logger.debug("search cache: %s", _cachedSearch.cache_info())
+        _cachedSearch.cache_clear()
@@ -9,6 +9,11 @@ from aqt.qt import *
 from aqt import mw 
 from .dictionaryWebInstallWizard import DictionaryWebInstallWizard
 from .freqConjWebWindow import FreqConjWebWindow
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 logger = logging.getLogger(__name__)
 
 class DictionaryManagerWidget(QWidget):
@@ -283,6 +288,13 @@ class DictionaryManagerWidget(QWidget):
         except OSError:
             pass
 
+        # Remove the parsed conjugation cache kept beside it
+        try:
+            path = os.path.join(addon_path, 'user_files', 'db', 'conjugation', '%s.pkl' % lang_name)
+            os.remove(path)
+        except OSError:
+            pass
+
         aqt.qt.sip.delete(lang_item)
 
 
@@ -546,7 +558,10 @@ def loadDict(zfile, filenames, lang, dictName, frequencyDict, miDict=False):
     jsonDict = []
     for filename in filenames:
         with zfile.open(filename, 'r') as jsonDictFile:
-            jsonDict += json.loads(jsonDictFile.read())
+            if orjson:
+                jsonDict += orjson.loads(jsonDictFile.read())
+            else:
+                jsonDict += json.load(jsonDictFile)
     if frequencyDict:
         print("FreqDICT!")
         if miDict:
@@ -29,7 +29,7 @@ function insertHTML(newHTML, ord, action, currentNoteId) {
 }
 
 try {
-  insertHTML("%s", "%s", "%s", "%s");
+  insertHTML("%s", %d, "%s", %d);
 } catch (e) {
   console.error("Error in insertHTML:", e);
 }
\ No newline at end of file
@@ -52,6 +52,9 @@ wrapperDict = False
 tmpdir = join(addon_path, 'temp')
 mw.misoEditorLoadedAfterDictionary = False
 mw.DictBulkMediaExportWasCancelled = False
+mw.ankiDictionaryVisible = False
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_READING_RE = re.compile(r'\[[^\]]+?\]')
 
 
 def refresh_anki_dict_config(config = False):
@@ -422,7 +425,7 @@ def selectedText(page):
 def searchTerm(self):
     text = selectedText(self)
     if text:
-        text = re.sub(r'\[[^\]]+?\]', '', text)
+        text = _READING_RE.sub('', text)
         text = text.strip()
         if not mw.ankiDictionary or not mw.ankiDictionary.isVisible():
             dictionaryInit([text])
@@ -629,10 +632,7 @@ def initImager():
     googleImager.setSearchRegion(config['googleSearchRegion'])
     googleImager.setSafeSearch(config["safeSearch"])
 
-def exportGoogleImages(term, howMany):
-    config = mw.addonManager.getConfig(__name__)
-    maxW = config['maxWidth']
-    maxH = config['maxHeight']
+def exportGoogleImages(term, howMany, maxW, maxH):
     if not googleImager:
         initImager()
     imgSeparator = ''
@@ -707,14 +707,16 @@ def exportForvoAudio(term, howMany, lang):
 
 def downloadForvoAudio( urls, howMany):
     tags = []
-    for url in urls:
+    mediaDir = mw.col.media.dir()
+    stamp = int(time.time() * 1000)
+    for idx, url in enumerate(urls):
         if len(tags) == howMany:
             break
         try:
             req = Request(url[3] , headers={'User-Agent':  'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_9_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.47 Safari/537.36'})
             file = urlopen(req).read()
-            filename = str(time.time()) + '.mp3'
-            open(join(mw.col.media.dir(), filename), 'wb').write(file)
+            filename = f'{stamp}_{idx}.mp3'
+            open(join(mediaDir, filename), 'wb').write(file)
             tags.append('[sound:' + filename + ']')
             success = True
         except: 
@@ -725,8 +727,8 @@ def downloadForvoAudio( urls, howMany):
             try:
                 req = Request(url[2] , headers={'User-Agent':  'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_9_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.47 Safari/537.36'})
                 file = urlopen(req).read()
-                filename = str(time.time()) + '.mp3'
-                open(join(mw.col.media.dir(), filename), 'wb').write(file)
+                filename = f'{stamp}_{idx}.mp3'
+                open(join(mediaDir, filename), 'wb').write(file)
                 tags.append('[sound:' + filename + ']')
             except:
                 continue
@@ -751,13 +753,13 @@ def addDefinitionsToCardExporterNote(note, term, dictionaryConfigurations):
         limit = dictionary["limit"]
         targetField = dictionary["field"]
         if targetField in fields:
-            term = re.sub(r'<[^>]+>', '', term) 
-            term = re.sub(r'\[[^\]]+?\]', '', term)
+            term = _HTML_TAG_RE.sub('', term) 
+            term = _READING_RE.sub('', term)
             if term == '':
                 continue
             tresults = []
             if tableName == 'Google Images':
-                tresults.append(exportGoogleImages(term, limit))
+                tresults.append(exportGoogleImages(term, limit, config['maxWidth'], config['maxHeight']))
             elif tableName == 'Forvo':
                 tresults.append(exportForvoAudio(term, limit, lang))
             elif tableName != 'None':
@@ -796,6 +798,8 @@ def exportDefinitions(og, dest, addType, dictNs, howMany, notes, generateWidget,
     fb = config['frontBracket']
     bb = config['backBracket']
     lang = config['ForvoLanguage']
+    maxW = config['maxWidth']
+    maxH = config['maxHeight']
     mw.progress.start()
     mw.DictExportingDefinitions = True
     for nid in notes:
@@ -804,15 +808,15 @@ def exportDefinitions(og, dest, addType, dictNs, howMany, notes, generateWidget,
         note = mw.col.getNote(nid)
         fields = mw.col.models.field_names(note.model())
         if og in fields and dest in fields:
-            term = re.sub(r'<[^>]+>', '', note[og]) 
-            term = re.sub(r'\[[^\]]+?\]', '', term)
+            term = _HTML_TAG_RE.sub('', note[og]) 
+            term = _READING_RE.sub('', term)
             if term == '':
                 continue
             tresults = []
             dCount = 0
             for dictN in dictNs:
                 if dictN == 'Google Images':
-                    tresults.append(exportGoogleImages( term, howMany))
+                    tresults.append(exportGoogleImages(term, howMany, maxW, maxH))
                 elif dictN == 'Forvo':
                     tresults.append(exportForvoAudio( term, howMany, lang))
                 elif dictN != 'None':
@@ -911,7 +915,14 @@ def checkCurrentEditor(self):
     if mw.ankiDictionary and mw.ankiDictionary.isVisible():
         mw.ankiDictionary.dict.checkEditorClose(self.editor)
 
-Browser.on_current_row_changed = wrap(Browser.on_current_row_changed, setBrowserEditor)
+def onBrowserRowChanged(browser, *args, **kwargs):
+    result = ogOnRowChanged(browser, *args, **kwargs)
+    if mw.ankiDictionaryVisible:
+        setBrowserEditor(browser)
+    return result
+
+ogOnRowChanged = Browser.on_current_row_changed
+Browser.on_current_row_changed = onBrowserRowChanged
 
 AddCards._close = wrap(AddCards._close, checkCurrentEditor)
 
@@ -3,9 +3,10 @@
 
 from aqt.utils import shortcut, saveGeom, saveSplitter, showInfo, askUser, ensureWidgetInScreenBoundaries
 import json
+import pickle
 import sys
 import math
-from anki.hooks import runHook
+from anki.hooks import runHook, addHook
 from aqt.qt import *
 from aqt.utils import openLink, tooltip
 from anki.utils import is_mac, is_win, is_lin
@@ -23,25 +24,210 @@ import time
 from . import dictdb
 import aqt
 from .miJapaneseHandler import miJHandler
-from urllib.request import Request, urlopen
 import requests
 import urllib.request
 from . import googleimages
 from .addonSettings import SettingsGui
 import datetime
-import codecs
 from .forvodl import Forvo
 import ntpath
+from html import escape
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from .miutils import miInfo
 
 try:
-    from PyQt6.QtSvgWidgets import QSvgWidget
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from PyQt6.QtSvg import QSvgRenderer
 except ModuleNotFoundError:
-    from PyQt5.QtSvg import QSvgWidget
+    from PyQt5.QtSvg import QSvgRenderer
 
 from .themeEditor import *
 from .themes import *
 
+_TAG_RE = re.compile(r'<[^>]*>')
+_EXAMPLE_RE = re.compile(r'「([^」]+)」(?![^<]*>)')
+_EXT_RE = re.compile(r'\..*$')
+_WS_RE = re.compile(r'\s')
+_QUERY_RE = re.compile(r'\?.*$')
+_JP_RE = re.compile('[\u3040-\u30ff\u4e00-\u9fff]')
+_CLEAN_TABLE = str.maketrans('', '', '%_「」')
+_BRACKET_SPAN_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)|《[^》]*》|（[^）]*）')
+_STRAY_BRACKETS = str.maketrans('', '', '()[]《》（）')
+
+# Upper bound on simultaneous image/audio downloads when exporting media
+_DOWNLOAD_WORKERS = 8
+# The downloads run while the window waits for them, so a stalled host must not hang it
+_DOWNLOAD_TIMEOUT = 10
+_DOWNLOAD_HEADERS = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_9_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.47 Safari/537.36'}
+
+# Term header templates, filled in with str.format_map by getPreparedTermHeader
+_DEFAULT_HEADER = '{f}<span class="listTerm">{t}</span>{b}{x}<span class="listAltTerm">{a}</span>{y}<span class="listPronunciation">{p}</span>'
+_DEFAULT_SB_HEADER = '{f}<span class="term mainword">{t}</span>{b}{x}<span class="altterm  mainword">{a}</span>{y}<span class="pronunciation">{p}</span>'
+_FIELD_CHECKBOX = '<label class="inCheckBox"><input{checked} onclick="handleFieldCheck(this)" class="inCheckBox" type="checkbox" value="{f}" />{f}</label>'
+
+# Colours used when the active theme file cannot be read
+_DEFAULT_THEME = {
+    "header_background": "#51576d",
+    "selector": "#949cbb",
+    "header_text": "#babbf1",
+    "search_term": "#f4b8e4",
+    "border": "#babbf1",
+    "anki_button_background": "#99d1db",
+    "anki_button_text": "#c6d0f5",
+    "tab_hover": "#f4b8e4",
+    "current_tab_gradient_top": "#737994",
+    "current_tab_gradient_bottom": "#414559",
+    "example_highlight": "#414559",
+    "definition_background": "#51576d",
+    "definition_text": "#c6d0f5",
+    "pitch_accent_color": "#eebebe"
+}
+
+
+# Stylesheets for the dictionary window and page, filled in from the active theme by buildThemeStyles
+_THEME_QSS = Template("""
+                    QWidget {
+                        background-color: ${definition_background};
+                        font-family: 'Segoe UI', sans-serif;
+                        font-size: 14px;
+                    }
+                    QPushButton {
+                        color: ${header_text};
+                        border: 1px solid ${border};
+                        border-radius: 5px;
+                        padding: 8px;
+                    }
+                    QPushButton:hover {
+                        border: 2px solid ${border};
+                    }
+                    QLineEdit, QComboBox {
+                        background-color: ${selector};
+                        color: ${search_term};
+                        border: 1px solid ${border};
+                        border-radius: 5px;
+                        padding: 8px;
+                    }
+                    QLabel {
+                        font-weight: bold;
+                        border: 1px solid ${border};
+                    }
+                    QComboBox QAbstractItemView {
+                        color: ${header_text};
+                        border: 1px solid ${border};
+                    }
+                    
+                    SVGPushButton{
+                        background-color: ${selector};
+                        color: ${header_text}
+                        border: 1px solid ${border};
+                    }
+                """)
+_THEME_CSS = Template("""
+            <style id="customThemeCss">
+                body {
+                    background-color: ${header_background};
+                    color: ${header_text};
+                }
+                .header {
+                    background-color: ${header_background};
+                    color: ${header_text};
+                    border-bottom: 2px solid ${border};
+                }
+                .targetTerm {
+                    color: ${search_term} !important;
+                }
+                .exampleSentence {
+                    background-color: ${example_highlight};
+                    border-radius: 3px;
+                    padding-top:1px;
+                    margin:0 5px;
+                }
+                .definitionBlock {
+                    background-color: ${definition_background};
+                    color: ${definition_text};
+                    border: 1px solid ${border};
+                    border-radius: 5px;
+                    padding: 15px;
+                    margin: 10px;
+                }
+                .altterm {
+                    color: ${pitch_accent_color};
+                }
+                .ankiExportButton {
+                    border: 1px solid ${border};
+                    border-radius: 5px;
+                    padding: 5px;
+                }
+                .ankiExportButton img {
+                    background-color: ${anki_button_background};
+                }
+                .tablinks {
+                    border: 1px solid ${border};
+                    border-radius: 5px 5px 0 0;
+                }
+                .tablinks.active {
+                    background-image: linear-gradient(
+                        ${current_tab_gradient_top},
+                        ${current_tab_gradient_bottom}
+                    );
+                    border-bottom: none;
+                }
+                .tablinks:hover {
+                    background-color: ${tab_hover};
+                }
+                .overwriteSelect, .fieldSelect {
+                    background-color: ${selector};
+                    border: 1px solid ${border};
+                    border-radius: 5px;
+                    padding: 5px;
+                }
+            </style>
+        """)
+
+
+@lru_cache(maxsize=64)
+def _jsEscape(text):
+    # Sending the same definition to several fields or dictionaries reuses the escaped copy
+    return text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+@lru_cache(maxsize=None)
+def _readStaticFile(path):
+    # For files shipped with the add-on, which do not change while Anki is running
+    with open(path, "r", encoding="utf-8") as staticFile:
+        return staticFile.read()
+
+
+@lru_cache(maxsize=128)
+def _loadThumbnail(path, mtime):
+    # Let the image plugin decode straight to thumbnail size instead of decoding the full image and scaling it down
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid():
+        size.scale(QSize(50, 50), Qt.AspectRatioMode.KeepAspectRatio)
+        reader.setScaledSize(size)
+    return QPixmap.fromImage(reader.read())
+
+
+def _svgPixmap(path, width, height, dpr):
+    key = '%s:%dx%d@%s' % (path, width, height, dpr)
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        QSvgRenderer(path).render(painter)
+        painter.end()
+        pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
 
 class MIDict(AnkiWebView):
     def __init__(self, dictInt, db, path, terms=False):
@@ -51,16 +237,16 @@ class MIDict(AnkiWebView):
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_9_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.47 Safari/537.36')
         self.terms = terms
         self.dictInt = dictInt
-        self.config = self.dictInt.getConfig()
-        self.jSend = self.config['jReadingEdit']
-        self.maxW = self.config['maxWidth']
-        self.maxH = self.config['maxHeight']
+        self.resetConfiguration(self.dictInt.getConfig())
+        self.actionHandlers = self.getActionHandlers()
         self.onBridgeCmd = self.handleDictAction
         self.db = db
         self.termHeaders = self.formatTermHeaders(self.db.getTermHeaders())
         self.dupHeaders = self.db.getDupHeaders()
         self.sType = False
         self.radioCount = 0
+        self.fieldNamesCache = None
+        self.pendingNotes = {}
         self.homeDir = path
         self.conjugations = self.loadConjugations()
         self.deinflect = True
@@ -69,12 +255,41 @@ class MIDict(AnkiWebView):
         self.reviewer = False
         self.threadpool = QThreadPool()
         self.customFontsLoaded = []
+        self.pendingFonts = []
+
+    def reset(self, terms=False):
+        # Reloads everything tied to the config and database for a reopened window, keeping the web view
+        self.terms = terms
+        self.resetConfiguration(self.dictInt.getConfig())
+        self.termHeaders = self.formatTermHeaders(self.db.getTermHeaders())
+        self.dupHeaders = self.db.getDupHeaders()
+        self.fieldNamesCache = None
+        self.conjugations = self.loadConjugations()
+        self.addWindow = False
+        self.currentEditor = False
+        self.reviewer = False
+        self.customFontsLoaded = []
+        self.pendingFonts = []
 
     def resetConfiguration(self, config):
         self.config = config
         self.jSend = self.config['jReadingEdit']
         self.maxW = self.config['maxWidth']
         self.maxH = self.config['maxHeight']
+        # Flags read once per rendered entry, cached so the render loops avoid config lookups
+        self._highlightTarget = self.config['highlightTarget']
+        self._highlightSentences = self.config['highlightSentences']
+        self._tooltips = self.config['tooltips']
+        if self._tooltips:
+            self._imgTooltip = ' title="Add this definition, or any selected text and this definition\'s header to the card exporter (opens the card exporter if it is not yet opened)." '
+            self._clipTooltip = ' title="Copy this definition, or any selected text to the clipboard." '
+            self._sendTooltip = ' title="Send this definition, or any selected text and this definition\'s header to the card exporter to this dictionary\'s target fields. It will send it to the current target window, be it an Editor window, or the Review window." '
+        else:
+            self._imgTooltip = ''
+            self._clipTooltip = ''
+            self._sendTooltip = ''
+        # Per-dictionary settings fragments, reused across renders until a setting changes
+        self.dictChunkCache = {}
 
     def showGoogleForvoMessage(self, message):
         miInfo(message, level='err')
@@ -95,14 +310,14 @@ class MIDict(AnkiWebView):
             sbHeaderString = ''
             for header in ths[dictname]:
                 if header == 'term':
-                    headerString += '◳f<span class="term mainword">◳t</span>◳b'
-                    sbHeaderString += '◳f<span class="listTerm">◳t</span>◳b'
+                    headerString += '{f}<span class="term mainword">{t}</span>{b}'
+                    sbHeaderString += '{f}<span class="listTerm">{t}</span>{b}'
                 elif header == 'altterm':
-                    headerString += '◳x<span class="altterm  mainword">◳a</span>◳y'
-                    sbHeaderString += '◳x<span class="listAltTerm">◳a</span>◳y'
+                    headerString += '{x}<span class="altterm  mainword">{a}</span>{y}'
+                    sbHeaderString += '{x}<span class="listAltTerm">{a}</span>{y}'
                 elif header == 'pronunciation':
-                    headerString += '<span class="pronunciation">◳p</span>'
-                    sbHeaderString += '<span class="listPronunciation">◳p</span>'
+                    headerString += '<span class="pronunciation">{p}</span>'
+                    sbHeaderString += '<span class="listPronunciation">{p}</span>'
             formattedHeaders[dictname] = [headerString, sbHeaderString]
         return formattedHeaders
 
@@ -118,24 +333,53 @@ class MIDict(AnkiWebView):
                 filePath = join(self.homeDir, "user_files", 'dictionaries', lang, "conjugations.json")
                 if not os.path.exists(filePath):
                     continue
+            conjugations[lang] = self.loadConjugationFile(filePath)
+        return conjugations
+
+    def loadConjugationFile(self, filePath):
+        # Parsed conjugation tables are cached as a pickle beside the JSON and reused until the JSON changes
+        cachePath = os.path.splitext(filePath)[0] + '.pkl'
+        try:
+            if os.path.getmtime(cachePath) >= os.path.getmtime(filePath):
+                with open(cachePath, 'rb') as cacheFile:
+                    return pickle.load(cacheFile)
+        except Exception:
+            pass
+        if orjson:
+            with open(filePath, "rb") as conjugationsFile:
+                conjugations = orjson.loads(conjugationsFile.read())
+        else:
             with open(filePath, "r", encoding="utf-8") as conjugationsFile:
-                conjugations[lang] = json.loads(conjugationsFile.read())
+                conjugations = json.load(conjugationsFile)
+        try:
+            with open(cachePath, 'wb') as cacheFile:
+                pickle.dump(conjugations, cacheFile, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Error caching conjugations: {e}")
         return conjugations
 
     def cleanTerm(self, term):
-        return term.replace("'", "\'").replace('%', '').replace('_', '').replace('「', '').replace('」', '')
+        return term.translate(_CLEAN_TABLE)
 
     def getFontFamily(self, group):
         if not group['font']:
             return ' '
         if group['customFont']:
-            return ' style="font-family:' + re.sub(r'\..*$', '', group['font']) + ';" '
+            return ' style="font-family:' + _EXT_RE.sub('', group['font']) + ';" '
         else:
             return ' style="font-family:' + group['font'] + ';" '
 
-    def injectFont(self, font):
-        name = re.sub(r'\..*$', '', font)
-        self.eval("addCustomFont('%s', '%s');" % (font, name))
+    def queueFont(self, font):
+        self.customFontsLoaded.append(font)
+        self.pendingFonts.append([font, _EXT_RE.sub('', font)])
+
+    def takeFontInjectionJS(self):
+        # All fonts seen since the last render are registered in the same eval as the render itself
+        if not self.pendingFonts:
+            return ''
+        js = "addCustomFonts(%s);" % json.dumps(self.pendingFonts, ensure_ascii=False)
+        self.pendingFonts = []
+        return js
 
     def getTabMode(self):
         if self.dictInt.tabB.singleTab:
@@ -151,50 +395,44 @@ class MIDict(AnkiWebView):
         html = self.prepareResults(
             self.db.searchTerm(term, selectedGroup, self.conjugations, self.sType.currentText(), self.deinflect,
                                str(dictDefs), maxDefs), cleaned, font)
-        html = html.replace('\n', '')
+        html = html.replace('\r', '<br>').replace('\n', '')
         return html, cleaned, singleTab;
 
     def addNewTab(self, term, selectedGroup):
         if selectedGroup['customFont'] and selectedGroup['font'] not in self.customFontsLoaded:
-            self.customFontsLoaded.append(selectedGroup['font'])
-            self.injectFont(selectedGroup['font'])
+            self.queueFont(selectedGroup['font'])
         html, cleaned, singleTab = self.getHTMLResult(term, selectedGroup)
-        self.eval("addNewTab('%s', '%s', %s);" % (html.replace('\r', '<br>').replace('\n', '<br>'), cleaned, singleTab))
+        self.eval(self.takeFontInjectionJS() + "addNewTab(%s, %s, %s);" % (json.dumps(html, ensure_ascii=False), json.dumps(cleaned, ensure_ascii=False), singleTab))
 
     def addResultWrappers(self, results):
-        for idx, result in enumerate(results):
-            if 'dictionaryTitleBlock' not in result:
-                results[idx] = '<div class="definitionBlock">' + result + '</div>'
-        return results
-
-    def escapePunctuation(self, term):
-        return re.sub(r'([.*+(\[\]{}\\?)!])', '\\\1', term)
-
-    def highlightTarget(self, text, term):
-        if self.config['highlightTarget']:
+        return [result if 'dictionaryTitleBlock' in result else '<div class="definitionBlock">' + result + '</div>'
+                for result in results]
+
+    def buildHighlightPattern(self, term):
+        # For Japanese text, we don't need word boundaries
+        if _JP_RE.search(term):
+            return re.compile('(' + re.escape(term) + ')')
+        # For non-Japanese text, keep word boundaries
+        return re.compile(r'\b(' + re.escape(term) + r')\b')
+
+    def highlightTarget(self, text, pattern):
+        if self._highlightTarget:
             if not isinstance(text, str):
                 text = str(text) if text is not None else ""
+            if not text:
+                return text
             try:
-                # Split text into HTML tags and content
-                parts = re.split(r'(<[^>]*>)', text)
-
-                # Only apply highlighting to non-tag parts
-                for i in range(0, len(parts), 2):  # Process only non-tag parts
-                    if parts[i]:  # Skip empty strings
-                        # For Japanese text, we don't need word boundaries
-                        if any('\u4e00' <= c <= '\u9fff' or '\u3040' <= c <= '\u309f' or '\u30a0' <= c <= '\u30ff' for c
-                               in term):
-                            pattern = '(' + self.escapePunctuation(term) + ')'
-                        else:
-                            # For non-Japanese text, keep word boundaries
-                            pattern = r'\b(' + self.escapePunctuation(term) + r')\b'
-
-                        parts[i] = re.sub(
-                            pattern,
-                            r'<span class="targetTerm">\1</span>',
-                            parts[i]
-                        )
-
+                # Walk the HTML tags, only applying highlighting to the content between them
+                parts = []
+                pos = 0
+                for tag in _TAG_RE.finditer(text):
+                    start = tag.start()
+                    if start > pos:
+                        parts.append(pattern.sub(r'<span class="targetTerm">\1</span>', text[pos:start]))
+                    parts.append(tag.group())
+                    pos = tag.end()
+                if pos < len(text):
+                    parts.append(pattern.sub(r'<span class="targetTerm">\1</span>', text[pos:]))
                 return ''.join(parts)
             except Exception as e:
                 print(f"Error during highlightTarget: {e}")
@@ -202,44 +440,38 @@ class MIDict(AnkiWebView):
         return text
 
     def highlightExamples(self, text):
-        if self.config['highlightSentences']:
-            return re.sub(
-                r'「([^」]+)」(?![^<]*>)',
-                r'<span class="exampleSentence">「\1」</span>',
-                text
-            )
+        if self._highlightSentences:
+            return _EXAMPLE_RE.sub(r'<span class="exampleSentence">「\1」</span>', text)
         return text
 
-    def getSideBar(self, results, term, font, frontBracket, backBracket):
-        html = '<div' + font + 'class="definitionSideBar"><div class="innerSideBar">'
+    def getSideBar(self, results, term, pattern, font, frontBracket, backBracket):
+        parts = ['<div', font, 'class="definitionSideBar"><div class="innerSideBar">']
         dictCount = 0
         entryCount = 0
         for dictName, dictResults in results.items():
             if dictName == 'Google Images' or dictName == 'Forvo':
-                html += '<div data-index="' + str(
-                    dictCount) + '" class="listTitle">' + dictName + '</div><ol class="foundEntriesList"><li data-index="' + str(
-                    entryCount) + '">' + self.getPreparedTermHeader(dictName, frontBracket, backBracket, term, term,
-                                                                    term, term, True) + '</li></ol>'
+                parts.extend(('<div data-index="', str(dictCount), '" class="listTitle">', dictName,
+                              '</div><ol class="foundEntriesList"><li data-index="', str(entryCount), '">',
+                              self.getPreparedTermHeader(dictName, frontBracket, backBracket, pattern, term, term,
+                                                         term, True),
+                              '</li></ol>'))
                 entryCount += 1
                 dictCount += 1
                 continue
-            html += '<div data-index="' + str(
-                dictCount) + '" class="listTitle">' + dictName + '</div><ol class="foundEntriesList">'
+            parts.extend(('<div data-index="', str(dictCount), '" class="listTitle">', dictName,
+                          '</div><ol class="foundEntriesList">'))
             dictCount += 1
-            for idx, entry in enumerate(dictResults):
-                html += ('<li data-index="' + str(entryCount) + '">' + self.getPreparedTermHeader(dictName,
-                                                                                                  frontBracket,
-                                                                                                  backBracket, term,
-                                                                                                  entry['term'],
-                                                                                                  entry['altterm'],
-                                                                                                  entry[
-                                                                                                      'pronunciation'],
-                                                                                                  True) + '</li>')
+            for entry in dictResults:
+                parts.extend(('<li data-index="', str(entryCount), '">',
+                              self.getPreparedTermHeader(dictName, frontBracket, backBracket, pattern, entry['term'],
+                                                         entry['altterm'], entry['pronunciation'], True),
+                              '</li>'))
                 entryCount += 1
-            html += '</ol>'
-        return html + '<br></div><div class="resizeBar" onmousedown="hresize(event)"></div></div>'
+            parts.append('</ol>')
+        parts.append('<br></div><div class="resizeBar" onmousedown="hresize(event)"></div></div>')
+        return ''.join(parts)
 
-    def getPreparedTermHeader(self, dictName, frontBracket, backBracket, target, term, altterm, pronunciation,
+    def getPreparedTermHeader(self, dictName, frontBracket, backBracket, pattern, term, altterm, pronunciation,
                               sb=False):
         altFB = frontBracket
         altBB = backBracket
@@ -252,71 +484,81 @@ class MIDict(AnkiWebView):
             altBB = ''
         if not self.termHeaders or (dictName == 'Google Images' or dictName == 'Forvo'):
             if sb:
-                header = '◳f<span class="term mainword">◳t</span>◳b◳x<span class="altterm  mainword">◳a</span>◳y<span class="pronunciation">◳p</span>'
+                header = _DEFAULT_SB_HEADER
             else:
-                header = '◳f<span class="listTerm">◳t</span>◳b◳x<span class="listAltTerm">◳a</span>◳y<span class="listPronunciation">◳p</span>'
+                header = _DEFAULT_HEADER
         else:
             if sb:
                 header = self.termHeaders[dictName][1]
             else:
                 header = self.termHeaders[dictName][0]
 
-        return header.replace('◳t', self.highlightTarget(term, target)).replace('◳a', self.highlightTarget(altterm,
-                                                                                                           target)).replace(
-            '◳p', self.highlightTarget(pronunciation, target)).replace('◳f', frontBracket).replace('◳b',
-                                                                                                   backBracket).replace(
-            '◳x', altFB).replace('◳y', altBB)
+        return header.format_map({
+            't': self.highlightTarget(term, pattern) if term else '',
+            'a': self.highlightTarget(altterm, pattern) if altterm else '',
+            'p': self.highlightTarget(pronunciation, pattern) if pronunciation else '',
+            'f': frontBracket,
+            'b': backBracket,
+            'x': altFB,
+            'y': altBB,
+        })
 
     def prepareResults(self, results, term, font):
         frontBracket = self.config['frontBracket']
         backBracket = self.config['backBracket']
         if len(results) > 0:
-            html = self.getSideBar(results, term, font, frontBracket, backBracket)
-            html += '<div class="mainDictDisplay">'
+            pattern = self.buildHighlightPattern(term)
+            parts = [self.getSideBar(results, term, pattern, font, frontBracket, backBracket),
+                     '<div class="mainDictDisplay">']
             dictCount = 0
             entryCount = 0
-            imgTooltip = ''
-            clipTooltip = ''
-            sendTooltip = ''
-            if self.config['tooltips']:
-                imgTooltip = ' title="Add this definition, or any selected text and this definition\'s header to the card exporter (opens the card exporter if it is not yet opened)." '
-                clipTooltip = ' title="Copy this definition, or any selected text to the clipboard." '
-                sendTooltip = ' title="Send this definition, or any selected text and this definition\'s header to the card exporter to this dictionary\'s target fields. It will send it to the current target window, be it an Editor window, or the Review window." '
+            imgTooltip = self._imgTooltip
+            clipTooltip = self._clipTooltip
+            sendTooltip = self._sendTooltip
             for dictName, dictResults in results.items():
+                # The name is appended to the page once per entry, share a single copy of it
+                dictName = sys.intern(dictName)
                 if dictName == 'Google Images':
-                    html += self.getGoogleDictionaryResults(term, dictCount, frontBracket, backBracket, entryCount,
-                                                            font)
+                    self.getGoogleDictionaryResults(parts, term, pattern, dictCount, frontBracket, backBracket,
+                                                    entryCount, font)
                     dictCount += 1
                     entryCount += 1
                     continue
                 if dictName == 'Forvo':
-                    html += self.getForvoDictionaryResults(term, dictCount, frontBracket, backBracket, entryCount, font)
+                    self.getForvoDictionaryResults(parts, term, pattern, dictCount, frontBracket, backBracket,
+                                                   entryCount, font)
                     dictCount += 1
                     entryCount += 1
                     continue
                 duplicateHeader = self.getDuplicateHeaderCB(dictName)
                 overwrite = self.getOverwriteChecks(dictCount, dictName)
                 select = self.getFieldChecks(dictName)
-                html += '<div data-index="' + str(
-                    dictCount) + '" class="dictionaryTitleBlock"><div  ' + font + '  class="dictionaryTitle">' + dictName.replace(
-                    '_',
-                    ' ') + '</div><div class="dictionarySettings">' + duplicateHeader + overwrite + select + '<div class="dictNav"><div onclick="navigateDict(event, false)" class="prevDict">▲</div><div onclick="navigateDict(event, true)" class="nextDict">▼</div></div></div></div>'
+                parts.extend(('<div data-index="', str(dictCount), '" class="dictionaryTitleBlock"><div  ', font,
+                              '  class="dictionaryTitle">', dictName.replace('_', ' '),
+                              '</div><div class="dictionarySettings">', duplicateHeader, overwrite, select,
+                              '<div class="dictNav"><div onclick="navigateDict(event, false)" class="prevDict">▲</div><div onclick="navigateDict(event, true)" class="nextDict">▼</div></div></div></div>'))
                 dictCount += 1
 
-                for idx, entry in enumerate(dictResults):
-                    html += ('<div data-index="' + str(
-                        entryCount) + '" class="termPronunciation"><span ' + font + ' class="tpCont">' + self.getPreparedTermHeader(
-                        dictName, frontBracket, backBracket, term, entry['term'], entry['altterm'],
-                        entry['pronunciation']) +
-                             ' <span class="starcount">' + entry[
-                                 'starCount'] + '</span></span><div class="defTools"><div onclick="ankiExport(event, \'' + dictName + '\')" class="ankiExportButton"><img ' + imgTooltip + ' ankiDict="icons/anki.png"></div><div onclick="clipText(event)" ' + clipTooltip + ' class="clipper">✂</div><div ' + sendTooltip + ' onclick="sendToField(event, \'' + dictName + '\')" class="sendToField">➠</div><div class="defNav"><div onclick="navigateDef(event, false)" class="prevDef">▲</div><div onclick="navigateDef(event, true)" class="nextDef">▼</div></div></div></div><div' + font + ' class="definitionBlock">' + self.highlightTarget(
-                                self.highlightExamples(entry['definition']), term)
-                             + '</div>')
+                for entry in dictResults:
+                    parts.extend(('<div data-index="', str(entryCount),
+                                  '" class="termPronunciation"><span ', font, ' class="tpCont">',
+                                  self.getPreparedTermHeader(dictName, frontBracket, backBracket, pattern,
+                                                             entry['term'], entry['altterm'], entry['pronunciation']),
+                                  ' <span class="starcount">', entry['starCount'],
+                                  '</span></span><div class="defTools"><div onclick="ankiExport(event, \'', dictName,
+                                  '\')" class="ankiExportButton"><img ', imgTooltip,
+                                  ' ankiDict="icons/anki.png"></div><div onclick="clipText(event)" ', clipTooltip,
+                                  ' class="clipper">✂</div><div ', sendTooltip, ' onclick="sendToField(event, \'',
+                                  dictName,
+                                  '\')" class="sendToField">➠</div><div class="defNav"><div onclick="navigateDef(event, false)" class="prevDef">▲</div><div onclick="navigateDef(event, true)" class="nextDef">▼</div></div></div></div><div',
+                                  font, ' class="definitionBlock">',
+                                  self.highlightTarget(self.highlightExamples(entry['definition']), pattern),
+                                  '</div>'))
                     entryCount += 1
-
+            html = ''.join(parts)
         else:
             html = '<style>.noresults{font-family: Arial;}.vertical-center{height: 400px; width: 60%; margin: 0 auto; display: flex; justify-content: center; align-items: center;}</style> </head> <div class="vertical-center noresults"> <div align="center"> <img ankiDict="icons/searchzero.svg" width="50px" height="40px"> <h3 align="center">No dictionary entries were found for "' + term + '".</h3> </div></div>'
-        return html.replace("'", "\\'")
+        return html
 
     def attemptFetchForvo(self, term, idName):
         forvo = Forvo(self.config['ForvoLanguage'])
@@ -336,36 +578,42 @@ class MIDict(AnkiWebView):
             "loadImageForvoHtml('%s', '%s');loadForvoDict(false, '%s');" % (html.replace('"', '\\"'), idName, idName))
 
 
-    def getForvoDictionaryResults(self, term, dictCount, bracketFront, bracketBack, entryCount, font):
+    def getForvoDictionaryResults(self, parts, term, pattern, dictCount, bracketFront, bracketBack, entryCount, font):
         dictName = 'Forvo'
         overwrite = self.getOverwriteChecks(dictCount, dictName)
         select = self.getFieldChecks(dictName)
         idName = 'fcon' + str(time.time())
         self.attemptFetchForvo(term, idName)
-        html = '<div data-index="' + str(
-            dictCount) + '" class="dictionaryTitleBlock"><div class="dictionaryTitle">' + dictName + '</div><div class="dictionarySettings">' + overwrite + select + '<div class="dictNav"><div onclick="navigateDict(event, false)" class="prevDict">▲</div><div onclick="navigateDict(event, true)" class="nextDict">▼</div></div></div></div>'
-        html += ('<div  data-index="' + str(
-            entryCount) + '"  class="termPronunciation"><span class="tpCont">' + bracketFront + '<span ' + font + ' class="terms">' +
-                 self.highlightTarget(term, term) +
-                 '</span>' + bracketBack + ' <span></span></span><div class="defTools"><div onclick="ankiExport(event, \'' + dictName + '\')" class="ankiExportButton"><img ankiDict="icons/anki.png"></div><div onclick="clipText(event)" class="clipper">✂</div><div onclick="sendToField(event, \'' + dictName + '\')" class="sendToField">➠</div><div class="defNav"><div onclick="navigateDef(event, false)" class="prevDef">▲</div><div onclick="navigateDef(event, true)" class="nextDef">▼</div></div></div></div><div id="' + idName + '" class="definitionBlock">')
-        html += 'Loading...'
-        html += '</div>'
-        return html
-
-    def getGoogleDictionaryResults(self, term, dictCount, bracketFront, bracketBack, entryCount, font):
+        parts.extend(('<div data-index="', str(dictCount), '" class="dictionaryTitleBlock"><div class="dictionaryTitle">',
+                      dictName, '</div><div class="dictionarySettings">', overwrite, select,
+                      '<div class="dictNav"><div onclick="navigateDict(event, false)" class="prevDict">▲</div><div onclick="navigateDict(event, true)" class="nextDict">▼</div></div></div></div>',
+                      '<div  data-index="', str(entryCount), '"  class="termPronunciation"><span class="tpCont">',
+                      bracketFront, '<span ', font, ' class="terms">', self.highlightTarget(term, pattern),
+                      '</span>', bracketBack,
+                      ' <span></span></span><div class="defTools"><div onclick="ankiExport(event, \'', dictName,
+                      '\')" class="ankiExportButton"><img ankiDict="icons/anki.png"></div><div onclick="clipText(event)" class="clipper">✂</div><div onclick="sendToField(event, \'',
+                      dictName,
+                      '\')" class="sendToField">➠</div><div class="defNav"><div onclick="navigateDef(event, false)" class="prevDef">▲</div><div onclick="navigateDef(event, true)" class="nextDef">▼</div></div></div></div>',
+                      '<div id="', idName, '" class="definitionBlock">', 'Loading...', '</div>'))
+
+    def getGoogleDictionaryResults(self, parts, term, pattern, dictCount, bracketFront, bracketBack, entryCount, font):
         dictName = 'Google Images'
         overwrite = self.getOverwriteChecks(dictCount, dictName)
         select = self.getFieldChecks(dictName)
         idName = 'gcon' + str(time.time())
-        html = '<div data-index="' + str(
-            dictCount) + '" class="dictionaryTitleBlock"><div class="dictionaryTitle">Google Images</div><div class="dictionarySettings">' + overwrite + select + '<div class="dictNav"><div onclick="navigateDict(event, false)" class="prevDict">▲</div><div onclick="navigateDict(event, true)" class="nextDict">▼</div></div></div></div>'
-        html += ('<div  data-index="' + str(
-            entryCount) + '" class="termPronunciation"><span class="tpCont">' + bracketFront + '<span ' + font + ' class="terms">' +
-                 self.highlightTarget(term, term) +
-                 '</span>' + bracketBack + ' <span></span></span><div class="defTools"><div onclick="ankiExport(event, \'' + dictName + '\')" class="ankiExportButton"><img ankiDict="icons/anki.png"></div><div onclick="clipText(event)" class="clipper">✂</div><div onclick="sendToField(event, \'' + dictName + '\')" class="sendToField">➠</div><div class="defNav"><div onclick="navigateDef(event, false)" class="prevDef">▲</div><div onclick="navigateDef(event, true)" class="nextDef">▼</div></div></div></div><div class="definitionBlock"><div class="imageBlock" id="' + idName + '">' + self.getGoogleImages(
-                    term, idName)
-                 + '</div></div>')
-        return html
+        parts.extend(('<div data-index="', str(dictCount),
+                      '" class="dictionaryTitleBlock"><div class="dictionaryTitle">Google Images</div><div class="dictionarySettings">',
+                      overwrite, select,
+                      '<div class="dictNav"><div onclick="navigateDict(event, false)" class="prevDict">▲</div><div onclick="navigateDict(event, true)" class="nextDict">▼</div></div></div></div>',
+                      '<div  data-index="', str(entryCount), '" class="termPronunciation"><span class="tpCont">',
+                      bracketFront, '<span ', font, ' class="terms">', self.highlightTarget(term, pattern),
+                      '</span>', bracketBack,
+                      ' <span></span></span><div class="defTools"><div onclick="ankiExport(event, \'', dictName,
+                      '\')" class="ankiExportButton"><img ankiDict="icons/anki.png"></div><div onclick="clipText(event)" class="clipper">✂</div><div onclick="sendToField(event, \'',
+                      dictName,
+                      '\')" class="sendToField">➠</div><div class="defNav"><div onclick="navigateDef(event, false)" class="prevDef">▲</div><div onclick="navigateDef(event, true)" class="nextDef">▼</div></div></div></div>',
+                      '<div class="definitionBlock"><div class="imageBlock" id="', idName, '">',
+                      self.getGoogleImages(term, idName), '</div></div>'))
 
     def getGoogleImages(self, term, idName):
         imager = googleimages.Google()
@@ -382,11 +630,17 @@ class MIDict(AnkiWebView):
         return [x.replace('\\', '\\\\') for x in urls]
 
     def getDuplicateHeaderCB(self, dictName):
+        key = ('dupHeader', dictName)
+        if key not in self.dictChunkCache:
+            self.dictChunkCache[key] = self.buildDuplicateHeaderCB(dictName)
+        return self.dictChunkCache[key]
+
+    def buildDuplicateHeaderCB(self, dictName):
         tooltip = ''
-        if self.config['tooltips']:
+        if self._tooltips:
             tooltip = ' title="Enable this option if this dictionary has the target word\'s header within the definition. Enabling this will prevent the addon from exporting duplicate header."'
         checked = ' '
-        className = 'checkDict' + re.sub(r'\s', '', dictName)
+        className = 'checkDict' + _WS_RE.sub('', dictName)
         if dictName in self.dupHeaders:
             num = self.dupHeaders[dictName]
             if num == 1:
@@ -399,84 +653,124 @@ class MIDict(AnkiWebView):
                 self.dictInt.initSearch(t)
             self.terms = False
 
+    def getActionHandlers(self):
+        return {
+            'AnkiDictionaryLoaded': self.maybeSearchTerms,
+            'forvo': self.handleForvoAction,
+            'updateTerm': self.handleUpdateTermAction,
+            'saveFS': self.handleFontSizeAction,
+            'setDup': self.handleDupHeaderAction,
+            'fieldsSetting': self.handleFieldsSettingAction,
+            'overwriteSetting': self.handleOverwriteSettingAction,
+            'clipped': self.handleClipAction,
+            'sendToField': self.handleSendToFieldAction,
+            'sendAudioToField': self.sendAudioToField,
+            'sendImgToField': self.sendImgToField,
+            'addDef': self.handleAddDefAction,
+            'audioExport': self.handleAudioExportAction,
+            'imgExport': self.handleImgExportAction,
+        }
+
     def handleDictAction(self, dAct):
-        if dAct.startswith("AnkiDictionaryLoaded"):
-            self.maybeSearchTerms(dAct)
-        elif dAct.startswith('forvo:'):
-            urls = json.loads(dAct[6:])
-            self.downloadForvoAudio(urls)
-        elif dAct.startswith('updateTerm:'):
-            term = dAct[11:]
-            self.dictInt.search.setText(term)
-        elif dAct.startswith('saveFS:'):
-            f1, f2 = dAct[7:].split(':')
-            self.dictInt.writeConfig('fontSizes', [int(f1), int(f2)])
-        elif dAct.startswith('setDup:'):
-            dup, name = dAct[7:].split('◳')
-            dup = int(dup)
-            self.dictInt.db.setDupHeader(dup, name)
-            self.dupHeaders = self.db.getDupHeaders()
-        elif dAct.startswith('fieldsSetting:'):
-            fields = json.loads(dAct[14:])
-            if fields['dictName'] == 'Google Images':
-                self.dictInt.writeConfig('GoogleImageFields', fields['fields'])
-            elif fields['dictName'] == 'Forvo':
-                self.dictInt.writeConfig('ForvoFields', fields['fields'])
-            else:
-                self.dictInt.updateFieldsSetting(fields['dictName'], fields['fields'])
-        elif dAct.startswith('overwriteSetting:'):
-            addType = json.loads(dAct[17:])
-            if addType['name'] == 'Google Images':
-                self.dictInt.writeConfig('GoogleImageAddType', addType['type'])
-            elif addType['name'] == 'Forvo':
-                self.dictInt.writeConfig('ForvoAddType', addType['type'])
-            else:
-                self.dictInt.updateAddType(addType['name'], addType['type'])
-        elif dAct.startswith('clipped:'):
-            text = dAct[8:]
-            self.dictInt.mw.app.clipboard().setText(text.replace('<br>', '\n'))
-        elif dAct.startswith('sendToField:'):
-            name, text = dAct[12:].split('◳◴')
-            self.sendToField(name, text)
-        elif dAct.startswith('sendAudioToField:'):
-            urls = dAct[17:]
-            self.sendAudioToField(urls)
-        elif dAct.startswith('sendImgToField:'):
-            urls = dAct[15:]
-            self.sendImgToField(urls)
-        elif dAct.startswith('addDef:'):
-            dictName, word, text = dAct[7:].split('◳◴')
-            self.addDefToExportWindow(dictName, word, text)
-        elif dAct.startswith('audioExport:'):
-            word, urls = dAct[12:].split('◳◴')
-            self.addAudioToExportWindow(word, urls)
-        elif dAct.startswith('imgExport:'):
-            word, urls = dAct[10:].split('◳◴')
-            self.addImgsToExportWindow(word, json.loads(urls))
+        prefix, _, payload = dAct.partition(':')
+        handler = self.actionHandlers.get(prefix)
+        if handler:
+            handler(payload)
+
+    def handleForvoAction(self, payload):
+        self.downloadForvoAudio(json.loads(payload))
+
+    def handleUpdateTermAction(self, payload):
+        self.dictInt.search.setText(payload)
+
+    def handleFontSizeAction(self, payload):
+        f1, f2 = payload.split(':')
+        self.dictInt.writeConfig('fontSizes', [int(f1), int(f2)])
+
+    def handleDupHeaderAction(self, payload):
+        dup, name = payload.split('◳')
+        self.dictInt.db.setDupHeader(int(dup), name)
+        self.dupHeaders = self.db.getDupHeaders()
+        self.dictChunkCache.clear()
+
+    def handleFieldsSettingAction(self, payload):
+        fields = json.loads(payload)
+        if fields['dictName'] == 'Google Images':
+            self.dictInt.writeConfig('GoogleImageFields', fields['fields'])
+        elif fields['dictName'] == 'Forvo':
+            self.dictInt.writeConfig('ForvoFields', fields['fields'])
+        else:
+            self.dictInt.updateFieldsSetting(fields['dictName'], fields['fields'])
+        self.dictChunkCache.clear()
+
+    def handleOverwriteSettingAction(self, payload):
+        addType = json.loads(payload)
+        if addType['name'] == 'Google Images':
+            self.dictInt.writeConfig('GoogleImageAddType', addType['type'])
+        elif addType['name'] == 'Forvo':
+            self.dictInt.writeConfig('ForvoAddType', addType['type'])
+        else:
+            self.dictInt.updateAddType(addType['name'], addType['type'])
+        self.dictChunkCache.clear()
+
+    def handleClipAction(self, payload):
+        self.dictInt.mw.app.clipboard().setText(payload.replace('<br>', '\n'))
+
+    def handleSendToFieldAction(self, payload):
+        name, text = payload.split('◳◴')
+        self.sendToField(name, text)
+
+    def handleAddDefAction(self, payload):
+        dictName, word, text = payload.split('◳◴')
+        self.addDefToExportWindow(dictName, word, text)
+
+    def handleAudioExportAction(self, payload):
+        word, urls = payload.split('◳◴')
+        self.addAudioToExportWindow(word, urls)
+
+    def handleImgExportAction(self, payload):
+        word, urls = payload.split('◳◴')
+        self.addImgsToExportWindow(word, json.loads(urls))
 
     def addImgsToExportWindow(self, word, urls):
         self.initCardExporterIfNeeded()
         imgSeparator = ''
         imgs = []
         rawPaths = []
-        for imgurl in urls:
-            try:
-                url = re.sub(r'\?.*$', '', imgurl)
-                filename = str(time.time())[:-4].replace('.', '') + re.sub(r'\..*$', '',
-                                                                           url.strip().split('/')[-1]) + '.jpg'
-                fullpath = join(self.dictInt.mw.col.media.dir(), filename)
-                self.saveQImage(imgurl, filename)
-                rawPaths.append(fullpath)
+        mediaDir = self.dictInt.mw.col.media.dir()
+        filenames = self.getImageFilenames(urls)
+        for filename, saved in zip(filenames, self.runConcurrently(self.downloadImage, urls, filenames)):
+            if saved:
+                rawPaths.append(join(mediaDir, filename))
                 imgs.append('<img ankiDict="' + filename + '">')
-            except:
-                continue
         if len(imgs) > 0:
             self.addWindow.addImgs(word, imgSeparator.join(imgs), self.getThumbs(rawPaths))
 
+    def runConcurrently(self, func, items, *args):
+        # Downloads are network bound, so fan them out over a small pool; results keep the input order
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(_DOWNLOAD_WORKERS, len(items))) as pool:
+            return list(pool.map(func, items, *args))
+
+    def getImageFilenames(self, urls):
+        # One timestamp per batch, made unique per image by its index
+        stamp = int(time.time() * 1000)
+        return [f'{stamp}_{idx}' + _EXT_RE.sub('', _QUERY_RE.sub('', url).strip().split('/')[-1]) + '.jpg'
+                for idx, url in enumerate(urls)]
+
+    def downloadImage(self, imgurl, filename):
+        try:
+            self.saveQImage(imgurl, filename)
+            return True
+        except (requests.RequestException, OSError) as e:
+            print(f"Error downloading image: {e}")
+            return False
+
     def saveQImage(self, url, filename):
-        req = Request(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_9_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.47 Safari/537.36'})
-        file = urlopen(req).read()
+        response = requests.get(url, headers=_DOWNLOAD_HEADERS, timeout=_DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        file = response.content
         image = QImage()
         image.loadFromData(file)
         image = image.scaled(QSize(self.maxW, self.maxH), Qt.AspectRatioMode.KeepAspectRatio,
@@ -492,9 +786,11 @@ class MIDict(AnkiWebView):
         hLayout.setContentsMargins(0, 0, 0, 0)
         vLayout.addLayout(hLayout)
         for idx, path in enumerate(paths):
-            image = QPixmap(path)
-            image = image.scaled(QSize(50, 50), Qt.AspectRatioMode.KeepAspectRatio,
-                                 Qt.TransformationMode.SmoothTransformation)
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                mtime = None
+            image = _loadThumbnail(path, mtime)
             label = QLabel('')
             label.setPixmap(image)
             label.setFixedSize(40, 40)
@@ -584,73 +880,53 @@ class MIDict(AnkiWebView):
         self.sendToField('Forvo', audioSeparator.join(soundFiles))
 
     def downloadForvoAudio(self, urls):
-        tags = []
-        for url in urls:
-            try:
-                req = Request(url, headers={
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_9_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.47 Safari/537.36'})
-                file = urlopen(req).read()
-                filename = str(time.time()) + '.mp3'
-                open(join(self.dictInt.mw.col.media.dir(), filename), 'wb').write(file)
-                tags.append('[sound:' + filename + ']')
-            except:
-                continue
-        return tags
+        mediaDir = self.dictInt.mw.col.media.dir()
+        stamp = int(time.time() * 1000)
+        filenames = [f'{stamp}_{idx}.mp3' for idx in range(len(urls))]
+        paths = [join(mediaDir, filename) for filename in filenames]
+        saved = self.runConcurrently(self.downloadAudio, urls, paths)
+        return ['[sound:' + filename + ']' for filename, ok in zip(filenames, saved) if ok]
+
+    def downloadAudio(self, url, path):
+        try:
+            response = requests.get(url, headers=_DOWNLOAD_HEADERS, timeout=_DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            with open(path, 'wb') as audioFile:
+                audioFile.write(response.content)
+            return True
+        except (requests.RequestException, OSError) as e:
+            print(f"Error downloading audio: {e}")
+            return False
 
     def sendImgToField(self, urls):
         if (self.reviewer and self.reviewer.card) or (self.currentEditor and self.currentEditor.note):
             urlsList = []
             imgSeparator = ''
             urls = json.loads(urls)
-            for imgurl in urls:
-                try:
-                    url = re.sub(r'\?.*$', '', imgurl)
-                    filename = str(time.time())[:-4].replace('.', '') + re.sub(r'\..*$', '',
-                                                                               url.strip().split('/')[-1]) + '.jpg'
-                    self.saveQImage(imgurl, filename)
+            filenames = self.getImageFilenames(urls)
+            for filename, saved in zip(filenames, self.runConcurrently(self.downloadImage, urls, filenames)):
+                if saved:
                     urlsList.append('<img ankiDict="' + filename + '">')
-                except:
-                    continue
             if len(urlsList) > 0:
                 self.sendToField('Google Images', imgSeparator.join(urlsList))
 
-    def sendToField(self, name, definition):
-        if self.reviewer and self.reviewer.card:
-            if name == 'Google Images':
-                tFields = self.config['GoogleImageFields']
-                addType = self.config['GoogleImageAddType']
-            elif name == 'Forvo':
-                tFields = self.config['ForvoFields']
-                addType = self.config['ForvoAddType']
-            else:
-                tFields, addType = self.db.getAddTypeAndFields(name)
-            note = self.reviewer.card.note()
-            model = note.model()
-            fields = model['flds']
-            changed = False
-            for field in fields:
-                if field['name'] in tFields:
-                    newField = self.getFieldContent(note[field['name']], definition, addType)
-                    if newField is not False:
-                        changed = True
-                        if self.jSend:
-                            note[field['name']] = self.dictInt.jHandler.attemptFieldGenerate(newField, field['name'],
-                                                                                             model['name'], note)
-                        else:
-                            note[field['name']] = newField
-            if not changed:
-                return
-            # note.flush()
-            self.dictInt.mw.col.update_note(note, skip_undo_entry=True);
-            # self.reviewer.card.load()
-            # self.reviewer.
+    def flushPendingNotes(self):
+        notes = list(self.pendingNotes.values())
+        self.pendingNotes.clear()
+        for note in notes:
+            self.dictInt.mw.col.update_note(note, skip_undo_entry=True)
+        if self.reviewer:
             if self.reviewer.state == 'answer':
                 self.reviewer._showAnswer()
             elif self.reviewer.state == 'question':
                 self.reviewer._showQuestion()
-            if hasattr(self.dictInt.mw, "DictReloadEditorAndBrowser"):
+        if hasattr(self.dictInt.mw, "DictReloadEditorAndBrowser"):
+            for note in notes:
                 self.dictInt.mw.DictReloadEditorAndBrowser(note)
-        if self.currentEditor and self.currentEditor.note:
+
+    def getSendTarget(self, name):
+        key = ('sendTarget', name)
+        if key not in self.dictChunkCache:
             if name == 'Google Images':
                 tFields = self.config['GoogleImageFields']
                 addType = self.config['GoogleImageAddType']
@@ -659,32 +935,48 @@ class MIDict(AnkiWebView):
                 addType = self.config['ForvoAddType']
             else:
                 tFields, addType = self.db.getAddTypeAndFields(name)
-            note = self.currentEditor.note
+            self.dictChunkCache[key] = (frozenset(tFields), addType)
+        return self.dictChunkCache[key]
 
-            items = note.items()
-            for idx, item in enumerate(items):
-                noteField = item[0]
-                if noteField in tFields:
-                    # Get the current note ID
-                    currentNoteId = note.id  # Assuming `note` is the current note object
-                    self.currentEditor.web.eval(
-                        self.dictInt.insertHTMLJS % (
-                            definition.replace('"', '\\"'),
-                            str(idx),  # Field index
-                            addType,  # Action type
-                            currentNoteId  # Pass the note ID to JavaScript
-                        )
-                    )
+    def sendToField(self, name, definition):
+        tFields, addType = self.getSendTarget(name)
+        if not tFields:
+            return
+        if self.reviewer and self.reviewer.card:
+            note = self.pendingNotes.get(self.reviewer.card.nid) or self.reviewer.card.note()
+            model = note.model()
+            targets = [field['name'] for field in model['flds'] if field['name'] in tFields]
+            changed = False
+            for fieldName in targets:
+                newField = self.getFieldContent(note[fieldName], definition, addType)
+                if newField is False:
+                    continue
+                changed = True
+                if self.jSend:
+                    note[fieldName] = self.dictInt.jHandler.attemptFieldGenerate(newField, fieldName, model['name'], note)
+                else:
+                    note[fieldName] = newField
+            if not changed:
+                return
+            # Sends arriving together (e.g. several dictionaries at once) are saved with one write and one redraw
+            if not self.pendingNotes:
+                QTimer.singleShot(50, self.flushPendingNotes)
+            self.pendingNotes[note.id] = note
+        if self.currentEditor and self.currentEditor.note:
+            note = self.currentEditor.note
+            indices = [idx for idx, noteField in enumerate(note.keys()) if noteField in tFields]
+            if not indices:
+                return
+            insertHTMLJS = self.dictInt.insertHTMLJS
+            escapedDefinition = _jsEscape(definition)
+            currentNoteId = note.id
+            for idx in indices:
+                self.currentEditor.web.eval(insertHTMLJS % (escapedDefinition, idx, addType, currentNoteId))
 
     def getOverwriteChecks(self, dictCount, dictName):
-        if dictName == 'Google Images':
-            addType = self.config['GoogleImageAddType']
-        elif dictName == 'Forvo':
-            addType = self.config['ForvoAddType']
-        else:
-            addType = self.db.getAddType(dictName)
+        addType = self.getSendTarget(dictName)[1]
         tooltip = ''
-        if self.config['tooltips']:
+        if self._tooltips:
             tooltip = ' title="This determines the conditions for sending a definition (or a Google Image) to a field. Overwrite the target field\'s content. Add to the target field\'s current contents. Only add definitions to the target field if it is empty."'
         if addType == 'add':
             typeName = '&nbsp;Add'
@@ -699,33 +991,25 @@ class MIDict(AnkiWebView):
 
     def getSelectedOverwriteType(self, dictName, addType):
         count = str(self.radioCount)
-        checked = ''
-        if addType == 'add':
-            checked = ' checked'
-        add = '<label class="inCheckBox"><input' + checked + ' onclick="handleAddTypeCheck(this)" class="inCheckBox radio' + dictName + '" type="radio" name="' + count + dictName + '" value="add"/>Add</label>'
-        checked = ''
-        if addType == 'overwrite':
-            checked = ' checked'
-        overwrite = '<label class="inCheckBox"><input' + checked + ' onclick="handleAddTypeCheck(this)" class="inCheckBox radio' + dictName + '" type="radio" name="' + count + dictName + '" value="overwrite"/>Overwrite</label>'
-        checked = ''
-        if addType == 'no':
-            checked = ' checked'
-        ifempty = '<label class="inCheckBox"><input' + checked + ' onclick="handleAddTypeCheck(this)" class="inCheckBox radio' + dictName + '" type="radio" name="' + count + dictName + '" value="no"/>If Empty</label>'
-        checks = ('<div class="overwriteCheckboxes" data-dictname="' + dictName + '">' +
-                  add + overwrite + ifempty +
-                  '</div>')
+        parts = ['<div class="overwriteCheckboxes" data-dictname="', dictName, '">']
+        for value, label in (('add', 'Add'), ('overwrite', 'Overwrite'), ('no', 'If Empty')):
+            parts.extend(('<label class="inCheckBox"><input', ' checked' if addType == value else '',
+                          ' onclick="handleAddTypeCheck(this)" class="inCheckBox radio', dictName,
+                          '" type="radio" name="', count, dictName, '" value="', value, '"/>', label, '</label>'))
+        parts.append('</div>')
         self.radioCount += 1
-        return checks
+        return ''.join(parts)
 
     def getFieldChecks(self, dictName):
-        if dictName == 'Google Images':
-            selF = self.config['GoogleImageFields']
-        elif dictName == 'Forvo':
-            selF = self.config['ForvoFields']
-        else:
-            selF = self.db.getFieldsSetting(dictName);
+        key = ('fieldChecks', dictName)
+        if key not in self.dictChunkCache:
+            self.dictChunkCache[key] = self.buildFieldChecks(dictName)
+        return self.dictChunkCache[key]
+
+    def buildFieldChecks(self, dictName):
+        selF = self.getSendTarget(dictName)[0]
         tooltip = ''
-        if self.config['tooltips']:
+        if self._tooltips:
             tooltip = ' title="Select this dictionary\'s target fields for when sending a definition(or a Google Image) to a card. If a field does not exist in the target card, then it is ignored, otherwise the definition is added to all fields that exist within the target card."'
         title = '&nbsp;Select Fields ▾'
         length = len(selF)
@@ -738,24 +1022,39 @@ class MIDict(AnkiWebView):
 
     def getCheckBoxes(self, dictName, selF):
         fields = self.getFieldNames()
-        options = '<div class="fieldCheckboxes"  data-dictname="' + dictName + '">'
+        parts = ['<div class="fieldCheckboxes"  data-dictname="', dictName, '">']
         for f in fields:
-            checked = ''
-            if f in selF:
-                checked = ' checked'
-            options += '<label class="inCheckBox"><input' + checked + ' onclick="handleFieldCheck(this)" class="inCheckBox" type="checkbox" value="' + f + '" />' + f + '</label>'
-        return options + '</div>'
+            parts.append(_FIELD_CHECKBOX.format(checked=' checked' if f in selF else '', f=escape(f)))
+        parts.append('</div>')
+        return ''.join(parts)
 
     def getFieldNames(self):
+        if self.fieldNamesCache is None:
+            self.fieldNamesCache = self.loadFieldNames()
+        return self.fieldNamesCache
+
+    def onOperationDidExecute(self, changes, handler):
+        # The field selectors are built from the note types, rebuild them once those change
+        if changes.notetype:
+            self.fieldNamesCache = None
+            self.dictChunkCache.clear()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Only listen while the window is open, reopening it rebuilds the cached selectors
+        if not event.spontaneous():
+            aqt.gui_hooks.operation_did_execute.remove(self.onOperationDidExecute)
+            aqt.gui_hooks.operation_did_execute.append(self.onOperationDidExecute)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not event.spontaneous():
+            aqt.gui_hooks.operation_did_execute.remove(self.onOperationDidExecute)
+
+    def loadFieldNames(self):
         mw = self.dictInt.mw
         models = mw.col.models.all()
-        fields = []
-        for model in models:
-            for fld in model['flds']:
-                if fld['name'] not in fields:
-                    fields.append(fld['name'])
-        fields.sort()
-        return fields
+        return sorted({fld['name'] for model in models for fld in model['flds']})
 
     def setCurrentEditor(self, editor, target=''):
         if editor != self.currentEditor:
@@ -974,7 +1273,7 @@ class ClipThread(QObject):
                     if is_mac:
                         try:
                             clip = str(self.mw.app.clipboard().mimeData().urls()[0].url())
-                        except:
+                        except IndexError:
                             return
                     if clip.startswith('file:///') and clip.endswith('.mp3'):
                         try:
@@ -985,8 +1284,8 @@ class ClipThread(QObject):
                             temp, mp3 = self.moveAudioToTempFolder(path)
                             if mp3:
                                 self.image.emit([temp, '[sound:' + mp3 + ']', mp3])
-                        except:
-                            return
+                        except OSError as e:
+                            print(f"Error exporting audio: {e}")
 
     def moveAudioToTempFolder(self, path):
         try:
@@ -997,7 +1296,8 @@ class ClipThread(QObject):
                     copyfile(path, destpath)
                     return destpath, filename;
             return False, False
-        except:
+        except OSError as e:
+            print(f"Error copying audio: {e}")
             return False, False
 
     def handleSentenceExport(self):
@@ -1017,11 +1317,31 @@ class DictInterface(QWidget):
         self.mw = mw
         self.parent = parent
         self.iconpath = join(path, 'icons')
+        # The combo styles only depend on the icon path, build them once
+        self.comboStyle = self.buildComboStyle()
+        self.macComboStyle = self.buildMacComboStyle()
 
         self.active_theme_file = join(self.addonPath, "user_files/themes", "active.json")
+        self.themeCache = None
+        self.themeStylesCache = {}
+        self.initHTMLPath = join(self.addonPath, 'dictionaryInit.html')
+        self.initHTMLURL = QUrl.fromLocalFile(self.initHTMLPath)
+        self.loadedThemeCss = None
+        self.childWidgetStyles = ''
+        # History changes are written out once searching pauses, or when the window is hidden or the profile unloads
+        self.historyDirty = False
+        self.historyTimer = QTimer(self)
+        self.historyTimer.setSingleShot(True)
+        self.historyTimer.setInterval(1000)
+        self.historyTimer.timeout.connect(self.flushHistory)
+        addHook("unloadProfile", self.flushHistory)
+        # The toolbar layout is only switched once a drag-resize settles
+        self.resizeTimer = QTimer(self)
+        self.resizeTimer.setSingleShot(True)
+        self.resizeTimer.setInterval(60)
+        self.resizeTimer.timeout.connect(self.applyResize)
         self.theme_manager = ThemeManager(self.addonPath)
-        self.theme_editor = ThemeEditorDialog(self.theme_manager, mw, path, self)
-        self.theme_editor.applied.connect(self.refresh_application_theme)
+        self.theme_editor = None
 
         self.startUp(terms)
         self.setHotkeys()
@@ -1031,57 +1351,47 @@ class DictInterface(QWidget):
         """
         Load a specific color from the active theme file.
         """
-        try:
-            with open(self.active_theme_file, "r") as f:
-                theme = json.load(f)
-                if color_key in theme:
-                    return QColor(theme[color_key])  # Ensure this returns a QColor
-        except Exception as e:
-            print(f"Error loading active theme color: {e}")
+        theme = self.loadActiveTheme()
+        if theme and color_key in theme:
+            return QColor(theme[color_key])  # Ensure this returns a QColor
         return QColor("#ffffff")  # Default color if anything fails
 
     def refresh_widget(self, widget):
         """
-        Recursively refresh a widget and its children.
+        Refresh a widget and all of its descendants.
         """
         widget.update()
-        widget.repaint()
+        # findChildren already returns every descendant, so no recursion is needed
         for child in widget.findChildren(QWidget):
-            self.refresh_widget(child)
+            child.update()
 
     def refresh_application_theme(self):
         """
         Refresh the application theme by updating styles and re-rendering components.
         """
-        # Load the active theme
-        active_theme_path = os.path.join(self.addonPath, "user_files/themes", "active.json")
-        try:
-            with open(active_theme_path, "r") as f:
-                active_theme = json.load(f)
-        except Exception as e:
-            print(f"Error loading active theme: {e}")
+        # Load the active theme, it may just have been edited
+        self.themeCache = None
+        if self.loadActiveTheme() is None:
             return
 
-        # Update the stylesheet for the entire widget
-        self.setStyleSheet(self.theme_manager.get_qt_styles())
-
-        # Update the stylesheet for child widgets (e.g., combo boxes, buttons, etc.)
+        # Rebuild the child widget styles (e.g., combo boxes, buttons, etc.)
         self.update_child_widget_styles()
 
-        # Re-render the dictionary interface
+        # Re-render the dictionary interface, which applies the combined stylesheet
         self.reload_dictionary_interface()
 
     def update_child_widget_styles(self):
         """
-        Update the styles of child widgets to reflect the new theme.
+        Build the child widget styles that are applied together with the window stylesheet.
         """
-        # Example: Update the combo box styles
-        self.dictGroups.setStyleSheet(self.theme_manager.get_combo_style())
-        self.sType.setStyleSheet(self.theme_manager.get_combo_style())
+        comboStyle = self.theme_manager.get_combo_style()
+        self.childWidgetStyles = (comboStyle.replace('QComboBox', 'QComboBox#dictGroups')
+                                  + comboStyle.replace('QComboBox', 'QComboBox#sType')
+                                  + self.theme_manager.get_button_style())
 
-        # Update button styles
-        for button in self.findChildren(QPushButton):
-            button.setStyleSheet(self.theme_manager.get_qt_styles())
+    def applyStyleSheet(self, qss):
+        # A single setStyleSheet call, so the window is only repolished once per theme change
+        self.setStyleSheet(qss + self.childWidgetStyles)
 
     def reload_dictionary_interface(self):
         """
@@ -1129,7 +1439,7 @@ class DictInterface(QWidget):
 
     def reloadConfig(self, config):
         self.config = config
-        self.dict.config = config
+        self.dict.resetConfiguration(config)
 
     def startUp(self, terms):
         terms = self.refineToValidSearchTerms(terms)
@@ -1137,9 +1447,11 @@ class DictInterface(QWidget):
         if terms is not False:
             willSearch = True
         self.allGroups = self.getAllGroups()
-        self.config = self.getConfig()
+        self.loadConfig()
         self.defaultGroups = self.db.getDefaultGroups()
         self.userGroups = self.getUserGroups()
+        self.defaultGroupNames = sorted(self.defaultGroups)
+        self.userGroupNames = sorted(self.userGroups)
         self.searchOptions = ['Forward', 'Backward', 'Exact', 'Anywhere', 'Definition', 'Example', 'Pronunciation']
         self.setWindowTitle("Anki Dictionary")
         self.dictGroups = self.setupDictGroups()
@@ -1172,7 +1484,7 @@ class DictInterface(QWidget):
         self.setMinimumSize(350, 350)
         self.sbOpened = False
         self.historyModel = HistoryModel(self.getHistory(), self)
-        self.historyBrowser = HistoryBrowser(self.historyModel, self)
+        self.historyBrowser = None
         self.setWindowIcon(QIcon(join(self.iconpath, 'miso.png')))
         self.readyToSearch = False
         self.restoreSizePos()
@@ -1215,152 +1527,49 @@ class DictInterface(QWidget):
 
     def refineToValidSearchTerms(self, terms):
         if terms:
-            validTerms = []
-            for term in terms:
-                term = term.strip()
-                term = self.cleanTermBrackets(term)
-                if term != '':
-                    validTerms.append(term)
+            validTerms = [term for term in (self.cleanTermBrackets(term.strip()) for term in terms) if term]
             if len(validTerms) > 0:
                 return validTerms
         return False
 
-    def getHTMLURL(self, willSearch):
-        active_theme_path = join(self.addonPath, "user_files/themes", "active.json")
+    def loadActiveTheme(self):
+        # The parsed theme is kept until active.json is modified
         try:
-            with open(active_theme_path, "r", encoding="utf-8") as f:
-                active_theme = json.load(f)
+            mtime = os.path.getmtime(self.active_theme_file)
+            if self.themeCache is None or self.themeCache[0] != mtime:
+                with open(self.active_theme_file, "r", encoding="utf-8") as f:
+                    self.themeCache = (mtime, json.load(f))
+            return self.themeCache[1]
         except Exception as e:
             print(f"Error loading active theme: {e}")
-            active_theme = {
-                "header_background": "#51576d",
-                "selector": "#949cbb",
-                "header_text": "#babbf1",
-                "search_term": "#f4b8e4",
-                "border": "#babbf1",
-                "anki_button_background": "#99d1db",
-                "anki_button_text": "#c6d0f5",
-                "tab_hover": "#f4b8e4",
-                "current_tab_gradient_top": "#737994",
-                "current_tab_gradient_bottom": "#414559",
-                "example_highlight": "#414559",
-                "definition_background": "#51576d",
-                "definition_text": "#c6d0f5",
-                "pitch_accent_color": "#eebebe"
-            }
+            return None
 
-        qss = f"""
-                    QWidget {{
-                        background-color: {active_theme["definition_background"]};
-                        font-family: 'Segoe UI', sans-serif;
-                        font-size: 14px;
-                    }}
-                    QPushButton {{
-                        color: {active_theme['header_text']};
-                        border: 1px solid {active_theme['border']};
-                        border-radius: 5px;
-                        padding: 8px;
-                    }}
-                    QPushButton:hover {{
-                        border: 2px solid {active_theme['border']};
-                    }}
-                    QLineEdit, QComboBox {{
-                        background-color: {active_theme['selector']};
-                        color: {active_theme['search_term']};
-                        border: 1px solid {active_theme['border']};
-                        border-radius: 5px;
-                        padding: 8px;
-                    }}
-                    QLabel {{
-                        font-weight: bold;
-                        border: 1px solid {active_theme['border']};
-                    }}
-                    QComboBox QAbstractItemView {{
-                        color: {active_theme['header_text']};
-                        border: 1px solid {active_theme['border']};
-                    }}
-                    
-                    SVGPushButton{{
-                        background-color: {active_theme['selector']};
-                        color: {active_theme['header_text']}
-                        border: 1px solid {active_theme['border']};
-                    }}
-                """
-        self.setStyleSheet(qss)
-        custom_theme_css = f"""
-            <style id="customThemeCss">
-                body {{
-                    background-color: {active_theme['header_background']};
-                    color: {active_theme['header_text']};
-                }}
-                .header {{
-                    background-color: {active_theme['header_background']};
-                    color: {active_theme['header_text']};
-                    border-bottom: 2px solid {active_theme['border']};
-                }}
-                .targetTerm {{
-                    color: {active_theme['search_term']} !important;
-                }}
-                .exampleSentence {{
-                    background-color: {active_theme['example_highlight']};
-                    border-radius: 3px;
-                    padding-top:1px;
-                    margin:0 5px;
-                }}
-                .definitionBlock {{
-                    background-color: {active_theme['definition_background']};
-                    color: {active_theme['definition_text']};
-                    border: 1px solid {active_theme['border']};
-                    border-radius: 5px;
-                    padding: 15px;
-                    margin: 10px;
-                }}
-                .altterm {{
-                    color: {active_theme['pitch_accent_color']};
-                }}
-                .ankiExportButton {{
-                    border: 1px solid {active_theme['border']};
-                    border-radius: 5px;
-                    padding: 5px;
-                }}
-                .ankiExportButton img {{
-                    background-color: {active_theme['anki_button_background']};
-                }}
-                .tablinks {{
-                    border: 1px solid {active_theme['border']};
-                    border-radius: 5px 5px 0 0;
-                }}
-                .tablinks.active {{
-                    background-image: linear-gradient(
-                        {active_theme['current_tab_gradient_top']},
-                        {active_theme['current_tab_gradient_bottom']}
-                    );
-                    border-bottom: none;
-                }}
-                .tablinks:hover {{
-                    background-color: {active_theme['tab_hover']};
-                }}
-                .overwriteSelect, .fieldSelect {{
-                    background-color: {active_theme['selector']};
-                    border: 1px solid {active_theme['border']};
-                    border-radius: 5px;
-                    padding: 5px;
-                }}
-            </style>
-        """
+    def getThemeStyles(self):
+        # Keyed by the theme's colours, so re-applying or switching back to a theme reuses its stylesheets
+        theme = self.loadActiveTheme() or _DEFAULT_THEME
+        key = frozenset(theme.items())
+        if key not in self.themeStylesCache:
+            self.themeStylesCache[key] = self.buildThemeStyles(theme)
+        return self.themeStylesCache[key]
 
-        html_path = join(self.addonPath, 'dictionaryInit.html')
-        with open(html_path, 'r', encoding="utf-8") as fh:
-            html = fh.read()
-            # Inject the custom theme CSS
-            html = html.replace('<style id="customThemeCss"></style>', custom_theme_css)
-            if not willSearch:
-                html = html.replace(
-                    '<script id="initialValue"></script>',
-                    f'<script id="initialValue">addNewTab(\'{self.welcome}\'); document.getElementsByClassName(\'tablinks\')[0].classList.add(\'active\');</script>'
-                )
-            url = QUrl.fromLocalFile(html_path)
-        return html, url
+    def buildThemeStyles(self, active_theme):
+        return _THEME_QSS.substitute(active_theme), _THEME_CSS.substitute(active_theme)
+
+    def getHTMLURL(self, willSearch):
+        qss, custom_theme_css = self.getThemeStyles()
+        self.applyStyleSheet(qss)
+        # Inject the custom theme CSS
+        html = _readStaticFile(self.initHTMLPath).replace('<style id="customThemeCss"></style>', custom_theme_css)
+        if not willSearch:
+            html = html.replace(
+                '<script id="initialValue"></script>',
+                f'<script id="initialValue">{self.getWelcomeTabJS()}</script>'
+            )
+        self.loadedThemeCss = custom_theme_css
+        return html, self.initHTMLURL
+
+    def getWelcomeTabJS(self):
+        return f"addNewTab('{self.welcome}'); document.getElementsByClassName('tablinks')[0].classList.add('active');"
 
     def getAllGroups(self):
         allGroups = {}
@@ -1370,9 +1579,7 @@ class DictInterface(QWidget):
         return allGroups
 
     def getInsertHTMLJS(self):
-        insertHTML = join(self.addonPath, "js", "insertHTML.js")
-        with open(insertHTML, "r", encoding="utf-8") as insertHTMLFile:
-            return insertHTMLFile.read()
+        return _readStaticFile(join(self.addonPath, "js", "insertHTML.js"))
 
     def focusWindow(self):
         self.show()
@@ -1384,7 +1591,16 @@ class DictInterface(QWidget):
     def closeEvent(self, event):
         self.hide()
 
+    def showEvent(self, event):
+        if not event.spontaneous():
+            self.mw.ankiDictionaryVisible = True
+        event.accept()
+
     def hideEvent(self, event):
+        # Minimizing sends a spontaneous hide, but the window is still open
+        if not event.spontaneous():
+            self.mw.ankiDictionaryVisible = False
+        self.flushHistory()
         self.saveSizeAndPos()
         shortcut = '(Ctrl+W)'
         if is_mac:
@@ -1399,20 +1615,21 @@ class DictInterface(QWidget):
             willSearch = True
         self.search.setText("")
         self.allGroups = self.getAllGroups()
-        self.config = self.getConfig()
+        self.loadConfig()
         self.defaultGroups = self.db.getDefaultGroups()
         self.userGroups = self.getUserGroups()
+        self.defaultGroupNames = sorted(self.defaultGroups)
+        self.userGroupNames = sorted(self.userGroups)
         self.dictGroups.currentIndexChanged.disconnect()
-        newDictGroupsCombo = self.setupDictGroups()
-        self.toolbarTopLayout.replaceWidget(self.dictGroups, newDictGroupsCombo)
-        self.dictGroups.close()
-        self.dictGroups.deleteLater()
-        self.dictGroups = newDictGroupsCombo
+        # Refill the existing combo box rather than building and swapping in a new one
+        self.dictGroups.blockSignals(True)
+        self.dictGroups.clear()
+        self.setupDictGroups(self.dictGroups)
+        self.dictGroups.blockSignals(False)
         previouslyOnTop = self.alwaysOnTop
         self.alwaysOnTop = self.config['dictAlwaysOnTop']
         if previouslyOnTop != self.alwaysOnTop:
             self.setAlwaysOnTop()
-        self.setAlwaysOnTop()
         if not self.config['showTarget']:
             self.currentTarget.hide()
             self.targetLabel.hide()
@@ -1438,26 +1655,33 @@ class DictInterface(QWidget):
         self.resetDict(willSearch, terms)
 
     def resetDict(self, willSearch, terms):
-        newDict = MIDict(self, self.db, self.addonPath, terms)
-        newDict.setSType(self.sType)
-        html, url = self.getHTMLURL(willSearch)
-        newDict.loadHTMLURL(html, url)
-        newDict.setSType(self.sType)
         if self.dict.addWindow and self.dict.addWindow.scrollArea.isVisible():
             self.dict.addWindow.saveSizeAndPos()
             self.dict.addWindow.scrollArea.close()
             self.dict.addWindow.scrollArea.deleteLater()
+        self.dict.reset(terms)
+        self.dict.setSType(self.sType)
+        qss, custom_theme_css = self.getThemeStyles()
+        if custom_theme_css == self.loadedThemeCss:
+            # The loaded page already has the right theme, so clear its tabs instead of reloading it
+            self.applyStyleSheet(qss)
+            js = "closeAllTabs();"
+            if not willSearch:
+                js += self.getWelcomeTabJS()
+            self.dict.eval(js)
+            reloaded = False
+        else:
+            html, url = self.getHTMLURL(willSearch)
+            self.dict.loadHTMLURL(html, url)
+            reloaded = True
         self.currentTarget.setText('')
-        self.dict.currentEditor = False
-        self.dict.reviewer = False
-        self.mainLayout.replaceWidget(self.dict, newDict)
-        self.dict.close()
-        self.dict.deleteLater()
-        self.dict = newDict
         if self.config['deinflect']:
             self.dict.deinflect = True
         else:
             self.dict.deinflect = False
+        if willSearch and not reloaded:
+            # Without a reload the page never sends AnkiDictionaryLoaded, so search the terms here
+            self.dict.maybeSearchTerms(None)
 
     def saveSizeAndPos(self):
         pos = self.pos()
@@ -1483,6 +1707,18 @@ class DictInterface(QWidget):
     def getConfig(self):
         return self.mw.addonManager.getConfig(__name__)
 
+    def loadConfig(self):
+        self.config = self.getConfig()
+        self.configMtime = self.getConfigMtime()
+
+    def getConfigMtime(self):
+        addonManager = self.mw.addonManager
+        metaPath = join(addonManager.addonsFolder(addonManager.addonFromModule(__name__)), 'meta.json')
+        try:
+            return os.path.getmtime(metaPath)
+        except OSError:
+            return None
+
     def setupView(self):
         layoutV = QVBoxLayout()
         layoutH = QHBoxLayout()
@@ -1548,6 +1784,10 @@ class DictInterface(QWidget):
             self.mainHLay.insertLayout(1, self.layoutH2)
 
     def resizeEvent(self, event):
+        self.resizeTimer.start()
+        event.accept()
+
+    def applyResize(self):
         w = self.width()
         if w < 702 and not self.verticalBar:
             self.verticalBar = True
@@ -1555,7 +1795,6 @@ class DictInterface(QWidget):
         elif w > 701 and self.verticalBar:
             self.verticalBar = False
             self.toggleMenuBar(False)
-        event.accept()
 
     def setupSearchButton(self):
         searchB = SVGPushButton(40, 40)
@@ -1619,6 +1858,8 @@ class DictInterface(QWidget):
         return history
 
     def openHistory(self):
+        if self.historyBrowser is None:
+            self.historyBrowser = HistoryBrowser(self.historyModel, self)
         if not self.historyBrowser.isVisible():
             self.historyBrowser.show()
 
@@ -1683,8 +1924,8 @@ class DictInterface(QWidget):
     #         self.refresh_application_theme()
 
     def setTheme(self):
-        theme_manager = ThemeManager(self.addonPath)
-        self.theme_editor = ThemeEditorDialog(theme_manager, self.mw, self.addonPath, self)
+        if self.theme_editor is None:
+            self.theme_editor = ThemeEditorDialog(self.theme_manager, self.mw, self.addonPath, self)
         self.theme_editor.exec()
         self.refresh_application_theme()
 
@@ -1770,17 +2011,18 @@ class DictInterface(QWidget):
         self.dict.eval("scaleFont(true)")
 
     def alignCenter(self, dictGroups):
+        model = dictGroups.model()
         for i in range(0, dictGroups.count()):
-            dictGroups.model().item(i).setTextAlignment(Qt.AlignmentFlag.alignCenter)
+            model.item(i).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
 
     def setupDictGroups(self, dictGroups=False):
         if not dictGroups:
             dictGroups = QComboBox()
+            dictGroups.setObjectName('dictGroups')
             dictGroups.setFixedHeight(30)
             dictGroups.setFixedWidth(80)
             dictGroups.setContentsMargins(0, 0, 0, 0)
-        ug = sorted(list(self.userGroups.keys()))
-        dictGroups.addItems(ug)
+        dictGroups.addItems(self.userGroupNames)
         dictGroups.addItem('──────')
         dictGroups.model().item(dictGroups.count() - 1).setEnabled(False)
         dictGroups.model().item(dictGroups.count() - 1).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1789,16 +2031,16 @@ class DictInterface(QWidget):
         dictGroups.addItem('──────')
         dictGroups.model().item(dictGroups.count() - 1).setEnabled(False)
         dictGroups.model().item(dictGroups.count() - 1).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        dg = sorted(list(self.defaultGroups.keys()))
-        dictGroups.addItems(dg)
+        dictGroups.addItems(self.defaultGroupNames)
         current = self.config['currentGroup']
-        if current in dg or current in ug or current in defaults:
+        if current in self.defaultGroups or current in self.userGroups or current in defaults:
             dictGroups.setCurrentText(current)
         dictGroups.currentIndexChanged.connect(lambda: self.writeConfig('currentGroup', dictGroups.currentText()))
         return dictGroups
 
     def setupSearchType(self):
         searchTypes = QComboBox()
+        searchTypes.setObjectName('sType')
         searchTypes.addItems(self.searchOptions)
         current = self.config['searchMode']
         if current in self.searchOptions:
@@ -1810,10 +2052,13 @@ class DictInterface(QWidget):
         return searchTypes
 
     def writeConfig(self, attribute, value):
-        newConfig = self.getConfig()
-        newConfig[attribute] = value
-        self.mw.addonManager.writeConfig(__name__, newConfig)
-        self.reloadConfig(newConfig)
+        # Other windows write the config directly, so only re-read it when it changed on disk
+        if self.getConfigMtime() != self.configMtime:
+            self.config = self.getConfig()
+        self.config[attribute] = value
+        self.mw.addonManager.writeConfig(__name__, self.config)
+        self.configMtime = self.getConfigMtime()
+        self.reloadConfig(self.config)
 
     def getSelectedDictGroup(self):
         cur = self.dictGroups.currentText()
@@ -1837,7 +2082,7 @@ class DictInterface(QWidget):
         self.activateWindow()
 
     def cleanTermBrackets(self, term):
-        return re.sub(r'(?:\[.*\])|(?:\(.*\))|(?:《.*》)|(?:（.*）)|\(|\)|\[|\]|《|》|（|）', '', term)[:30]
+        return _BRACKET_SPAN_RE.sub('', term).translate(_STRAY_BRACKETS)[:30]
 
     def initSearch(self, term=False):
         self.ensureVisible()
@@ -1857,20 +2102,35 @@ class DictInterface(QWidget):
     def addToHistory(self, term):
         date = str(datetime.date.today())
         self.historyModel.insertRows(term=term, date=date)
-        self.saveHistory()
 
     def saveHistory(self):
+        self.historyDirty = True
+        self.historyTimer.start()
+
+    def flushHistory(self):
+        self.historyTimer.stop()
+        if not self.historyDirty:
+            return
+        self.historyDirty = False
         path = join(self.mw.col.media.dir(), '_searchHistory.json')
-        with codecs.open(path, "w", "utf-8") as outfile:
-            json.dump(self.historyModel.history, outfile, ensure_ascii=False)
-        return
+        tempPath = path + '.tmp'
+        if orjson:
+            with open(tempPath, "wb") as outfile:
+                outfile.write(orjson.dumps(self.historyModel.history))
+        else:
+            with open(tempPath, "w", encoding="utf-8", newline="") as outfile:
+                json.dump(self.historyModel.history, outfile, ensure_ascii=False)
+        os.replace(tempPath, path)
 
     def getHistory(self):
         path = join(self.mw.col.media.dir(), '_searchHistory.json')
         try:
             if exists(path):
+                if orjson:
+                    with open(path, "rb") as histFile:
+                        return orjson.loads(histFile.read())
                 with open(path, "r", encoding="utf-8") as histFile:
-                    return json.loads(histFile.read())
+                    return json.load(histFile)
         except:
             return []
         return []
@@ -1914,6 +2174,9 @@ class DictInterface(QWidget):
             '''
 
     def getMacComboStyle(self):
+        return self.macComboStyle
+
+    def buildMacComboStyle(self):
         return '''
 QComboBox {color: black; border-radius: 3px; border: 1px solid black;}
 QComboBox:hover {border: 1px solid black;}
@@ -2013,6 +2276,9 @@ QScrollBar:vertical {
         '''
 
     def getComboStyle(self):
+        return self.comboStyle
+
+    def buildComboStyle(self):
         return '''
 QComboBox {color: white; border-radius: 3px; border: 1px solid gray;}
 QComboBox:hover {border: 1px solid white;}
@@ -2187,32 +2453,20 @@ QScrollBar:vertical {
 #         subcontrol-origin: margin;
 #     }'''
 
-class DictSVG(QSvgWidget):
-    clicked = pyqtSignal()
-
-    def __init__(self, parent=None):
-        QSvgWidget.__init__(self, parent)
-
-    def mousePressEvent(self, ev):
-        self.clicked.emit()
-
-
 class SVGPushButton(QPushButton):
     def __init__(self, width, height):
         super().__init__()
         self.setFixedSize(width, height)  # Set the fixed size of the button
-        self.layout = QHBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
-        self.svgWidget = None  # Placeholder for the SVG widget
+        self.svgPixmap = None
 
     def setSvg(self, svgPath):
-        # Remove the existing SVG widget if it exists
-        if self.svgWidget:
-            self.layout.removeWidget(self.svgWidget)
-            self.svgWidget.deleteLater()
-
-        # Create a new SVG widget and add it to the layout
-        self.svgWidget = QSvgWidget(svgPath)
-        self.svgWidget.setFixedSize(self.width(), self.height())  # Match the button's size
-        self.layout.addWidget(self.svgWidget)
+        # Icons are rendered once per size and shared between buttons through the pixmap cache
+        self.svgPixmap = _svgPixmap(svgPath, self.width(), self.height(), self.devicePixelRatioF())
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.svgPixmap is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self.svgPixmap)
+            painter.end()
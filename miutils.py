@@ -4,41 +4,43 @@
 import aqt
 from aqt.qt import *
 from os.path import dirname, join
-from aqt.webview import AnkiWebView
+from functools import lru_cache
 
 
 addon_path = dirname(__file__)
 
-def miInfo(text, parent=False, level = 'msg', day = True):
-    if level == 'wrn':
-        title = "Anki Dictionary Warning"
-    elif level == 'not':
-        title = "Anki Dictionary Notice"
-    elif level == 'err':
-        title = "Anki Dictionary Error"
-    else:
-        title = "Anki Dictionary"
-    if parent is False:
-        parent = aqt.mw.app.activeWindow() or aqt.mw
-    icon = QIcon(join(addon_path, 'icons', 'miso.png'))
+@lru_cache(maxsize=None)
+def _misoIcon():
+    return QIcon(join(addon_path, 'icons', 'miso.png'))
+
+_messageBoxes = {}
+
+def _getMessageBox(key, parent, build):
+    # Message boxes are built once per kind and parent, later calls only change the text
+    mb = _messageBoxes.get(key)
+    if mb is None:
+        mb = build(parent)
+        _messageBoxes[key] = mb
+        mb.destroyed.connect(lambda: _messageBoxes.pop(key, None))
+    elif mb.isVisible():
+        # Already showing, e.g. a message raised from inside another one's event loop
+        mb = build(parent)
+    return mb
+
+def _buildInfoBox(parent, title, day):
     mb = QMessageBox(parent)
     if not day:
         mb.setStyleSheet(" QMessageBox {background-color: #272828;}")
-    mb.setText(text)
-    mb.setWindowIcon(icon)
+    mb.setWindowIcon(_misoIcon())
     mb.setWindowTitle(title)
     b = mb.addButton(QMessageBox.StandardButton.Ok)
     b.setFixedSize(100, 30)
     b.setDefault(True)
+    return mb
 
-    return mb.exec()
-
-def miAsk(text, parent=None, day=True, customText = False):
-
+def _buildAskBox(parent, day, customText):
     msg = QMessageBox(parent)
     msg.setWindowTitle("Anki Dictionary")
-    msg.setText(text)
-    icon = QIcon(join(addon_path, 'icons', 'miso.png'))
     b = msg.addButton(QMessageBox.StandardButton.Yes)
     
     b.setFixedSize(100, 30)
@@ -54,9 +56,32 @@ def miAsk(text, parent=None, day=True, customText = False):
     
     if not day:
         msg.setStyleSheet(" QMessageBox {background-color: #272828;}")
-    msg.setWindowIcon(icon)
+    msg.setWindowIcon(_misoIcon())
+    return msg
+
+def miInfo(text, parent=False, level = 'msg', day = True):
+    if level == 'wrn':
+        title = "Anki Dictionary Warning"
+    elif level == 'not':
+        title = "Anki Dictionary Notice"
+    elif level == 'err':
+        title = "Anki Dictionary Error"
+    else:
+        title = "Anki Dictionary"
+    if parent is False:
+        parent = aqt.mw.app.activeWindow() or aqt.mw
+    mb = _getMessageBox(('info', title, day, parent), parent, lambda p: _buildInfoBox(p, title, day))
+    mb.setText(text)
+
+    return mb.exec()
+
+def miAsk(text, parent=None, day=True, customText = False):
+    if customText:
+        customText = tuple(customText)
+    msg = _getMessageBox(('ask', day, customText, parent), parent, lambda p: _buildAskBox(p, day, customText))
+    msg.setText(text)
     msg.exec()
-    if msg.clickedButton() == b:
+    if msg.clickedButton() == msg.button(QMessageBox.StandardButton.Yes):
         return True
     else:
         return False
@@ -150,7 +150,7 @@ class ThemeEditorDialog(QDialog):
 
     def _save_active_theme(self, colors):
         try:
-            theme_data = vars(colors)
+            theme_data = colors.to_dict()
             theme_data["active_theme_name"] = self.theme_combo.currentText()
             with open(self.active_theme_file, "w") as f:
                 json.dump(theme_data, f, indent=2)
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from typing import Dict
 import json
 import os
@@ -9,6 +10,11 @@ from aqt import mw
 
 @dataclass
 class ThemeColors:
+    __slots__ = ('header_background', 'selector', 'header_text', 'search_term', 'border',
+                 'anki_button_background', 'anki_button_text', 'tab_hover',
+                 'current_tab_gradient_top', 'current_tab_gradient_bottom', 'example_highlight',
+                 'definition_background', 'definition_text', 'pitch_accent_color')
+
     # Base colors
     header_background: str  # Previously "background"
     selector: str  # Previously "background_secondary"
@@ -33,6 +39,14 @@ class ThemeColors:
     definition_text: str  # Previously "definitionBlock_color"
     pitch_accent_color: str  # Previously "altterm_color"
 
+    def to_dict(self):
+        return dict(zip(_THEME_FIELDS, _getThemeValues(self)))
+
+
+_THEME_FIELDS = tuple(f.name for f in fields(ThemeColors))
+_getThemeValues = attrgetter(*_THEME_FIELDS)
+
+
 class ThemeManager:
     def __init__(self, addon_path):
         self.addon_path = addon_path
@@ -131,7 +145,7 @@ class ThemeManager:
         self._save_themes()
         os.makedirs(os.path.dirname(self.active_theme_file), exist_ok=True)
         with open(self.active_theme_file, 'o') as f:
-            themes_dict = {name: vars(colors) for name, colors in self.themes.items()}
+            themes_dict = {name: colors.to_dict() for name, colors in self.themes.items()}
             json.dump(themes_dict, f, indent=2)
 
     def _save_themes(self):
@@ -139,7 +153,7 @@ class ThemeManager:
         print(self.themes_file)
         print(os.path.dirname(self.themes_file))
         with open(self.themes_file, 'w') as f:
-            themes_dict = {name: vars(colors) for name, colors in self.themes.items()}
+            themes_dict = {name: colors.to_dict() for name, colors in self.themes.items()}
             print(os.path.dirname(self.themes_file))
             print(themes_dict)
             json.dump(themes_dict, f, indent=2)
@@ -242,6 +256,13 @@ class ThemeManager:
                 color: {theme.header_text};
                 background: {theme.header_background};
             }}
+            ''' + self.get_button_style(theme_name)
+
+    def get_button_style(self, theme_name: str = None) -> str:
+        """Generate Qt styles for QPushButton"""
+        theme = self.themes[theme_name or self.current_theme]
+
+        return f'''
             QPushButton {{
                 border: 1px solid {theme.border};
                 border-radius: 5px;